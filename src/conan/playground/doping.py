@@ -2,21 +2,21 @@ from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
     from conan.playground.structures import MaterialStructure
-    from conan.playground.utils import get_neighbors_via_edges, minimum_image_distance
+    from conan.playground.utils import get_neighbors_via_edges, minimum_image_distance_vectorized
 
 # import math
 import random
 import warnings
 from collections import defaultdict, namedtuple
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 from enum import Enum
 from typing import Dict, List, Optional, Set, Tuple
 
 import networkx as nx
-import pandas as pd
+import numpy as np
 from pulp import PULP_CBC_CMD, LpMinimize, LpProblem, LpStatusOptimal, LpVariable, lpSum
 
-from conan.playground.utils import get_neighbors_via_edges, minimum_image_distance
+from conan.playground.utils import get_neighbors_via_edges, minimum_image_distance_vectorized
 
 # Define a namedtuple for structural components
 # This namedtuple will be used to store the atom(s) around which the doping structure is built and its/their neighbors
@@ -191,6 +191,275 @@ class NitrogenSpecies(Enum):
             return 2
         return 0
 
+    @staticmethod
+    def get_cycle_length(nitrogen_species: "NitrogenSpecies") -> int:
+        """
+        Get the number of atoms in the cycle that is formed around the removed carbon atom(s) of a nitrogen species.
+
+        Parameters
+        ----------
+        nitrogen_species : NitrogenSpecies
+            The type of nitrogen doping.
+
+        Returns
+        -------
+        int
+            The number of atoms in the cycle of the doping structure (0 if the species does not form a cycle).
+        """
+        if nitrogen_species in {NitrogenSpecies.PYRIDINIC_1, NitrogenSpecies.PYRIDINIC_2, NitrogenSpecies.PYRIDINIC_3}:
+            return 12
+        if nitrogen_species == NitrogenSpecies.PYRIDINIC_4:
+            return 14
+        return 0
+
+
+# Properties for PYRIDINIC_4 nitrogen species with target bond lengths and angles
+_PYRIDINIC_4_PROPERTIES = NitrogenSpeciesProperties(
+    target_bond_lengths_cycle=[
+        1.45,
+        1.34,
+        1.32,
+        1.47,
+        1.32,
+        1.34,
+        1.45,
+        1.45,
+        1.34,
+        1.32,
+        1.47,
+        1.32,
+        1.34,
+        1.45,
+    ],
+    target_angles_cycle=[
+        120.26,
+        121.02,
+        119.3,
+        119.3,
+        121.02,
+        120.26,
+        122.91,
+        120.26,
+        121.02,
+        119.3,
+        119.3,
+        121.02,
+        120.26,
+        122.91,
+    ],
+    target_bond_lengths_neighbors=[
+        1.43,
+        1.43,
+        1.42,
+        1.42,
+        1.43,
+        1.43,
+        1.43,
+        1.42,
+        1.42,
+        1.43,
+    ],
+    target_angles_neighbors=[
+        118.54,
+        118.54,
+        118.86,
+        120.88,
+        122.56,
+        118.14,
+        118.14,
+        122.56,
+        120.88,
+        118.86,
+        118.54,
+        118.54,
+        118.86,
+        120.88,
+        122.56,
+        118.14,
+        118.14,
+        122.56,
+        120.88,
+        118.86,
+    ],
+)
+# Properties for PYRIDINIC_3 nitrogen species with target bond lengths and angles
+_PYRIDINIC_3_PROPERTIES = NitrogenSpeciesProperties(
+    target_bond_lengths_cycle=[1.45, 1.33, 1.33, 1.45, 1.45, 1.33, 1.33, 1.45, 1.45, 1.33, 1.33, 1.45],
+    target_angles_cycle=[
+        120.00,
+        122.17,
+        120.00,
+        122.21,
+        120.00,
+        122.17,
+        120.00,
+        122.21,
+        120.00,
+        122.17,
+        120.00,
+        122.21,
+    ],
+    target_bond_lengths_neighbors=[
+        1.42,
+        1.43,
+        1.43,
+        1.42,
+        1.43,
+        1.43,
+        1.42,
+        1.43,
+        1.43,
+    ],
+    target_angles_neighbors=[
+        118.88,
+        118.88,
+        118.92,
+        121.10,
+        121.10,
+        118.92,
+        118.88,
+        118.88,
+        118.92,
+        121.10,
+        121.10,
+        118.92,
+        118.88,
+        118.88,
+        118.92,
+        121.10,
+        121.10,
+        118.92,
+    ],
+)
+# Properties for PYRIDINIC_2 nitrogen species with target bond lengths and angles
+_PYRIDINIC_2_PROPERTIES = NitrogenSpeciesProperties(
+    target_bond_lengths_cycle=[1.39, 1.42, 1.42, 1.33, 1.35, 1.44, 1.44, 1.35, 1.33, 1.42, 1.42, 1.39],
+    target_angles_cycle=[
+        125.51,
+        118.04,
+        117.61,
+        120.59,
+        121.71,
+        122.14,
+        121.71,
+        120.59,
+        117.61,
+        118.04,
+        125.51,
+        125.04,
+    ],
+    target_bond_lengths_neighbors=[
+        1.45,
+        1.41,
+        1.41,
+        1.44,
+        1.44,
+        1.44,
+        1.41,
+        1.41,
+        1.45,
+    ],
+    target_angles_neighbors=[
+        116.54,
+        117.85,
+        121.83,
+        120.09,
+        119.20,
+        123.18,
+        119.72,
+        118.55,
+        118.91,
+        118.91,
+        118.55,
+        119.72,
+        123.18,
+        119.20,
+        120.09,
+        121.83,
+        117.85,
+        116.54,
+    ],
+)
+# Properties for PYRIDINIC_1 nitrogen species with target bond lengths and angles
+_PYRIDINIC_1_PROPERTIES = NitrogenSpeciesProperties(
+    target_bond_lengths_cycle=[1.31, 1.42, 1.45, 1.51, 1.42, 1.40, 1.40, 1.42, 1.51, 1.45, 1.42, 1.31, 1.70],
+    target_angles_cycle=[
+        115.48,
+        118.24,
+        128.28,
+        109.52,
+        112.77,
+        110.35,
+        112.77,
+        109.52,
+        128.28,
+        118.24,
+        115.48,
+        120.92,
+    ],
+    target_bond_lengths_neighbors=[
+        1.41,
+        1.42,
+        1.48,
+        1.41,
+        1.38,
+        1.41,
+        1.48,
+        1.42,
+        1.41,
+    ],
+    target_angles_neighbors=[
+        121.99,
+        122.51,
+        115.67,
+        126.09,
+        111.08,
+        120.63,
+        131.00,
+        116.21,
+        124.82,
+        124.82,
+        116.21,
+        131.00,
+        120.63,
+        111.08,
+        126.09,
+        115.67,
+        122.51,
+        121.99,
+    ],
+    target_angles_additional_angles=[
+        148.42,
+        102.06,
+        102.06,
+        148.42,
+    ],
+)
+# graphitic_properties = NitrogenSpeciesProperties(
+#     target_bond_lengths=[1.42],
+#     target_angles=[120.0],
+# )
+
+# Dictionary mapping each NitrogenSpecies to its corresponding properties
+NITROGEN_SPECIES_PROPERTIES: Dict[NitrogenSpecies, NitrogenSpeciesProperties] = {
+    NitrogenSpecies.PYRIDINIC_4: _PYRIDINIC_4_PROPERTIES,
+    NitrogenSpecies.PYRIDINIC_3: _PYRIDINIC_3_PROPERTIES,
+    NitrogenSpecies.PYRIDINIC_2: _PYRIDINIC_2_PROPERTIES,
+    NitrogenSpecies.PYRIDINIC_1: _PYRIDINIC_1_PROPERTIES,
+    # NitrogenSpecies.GRAPHITIC: graphitic_properties,
+}
+
+# Order in which the doping structures are inserted: species are sorted by the number of removed carbon atoms as well as
+# the number of contributing nitrogen atoms in decreasing order, so that larger structures are inserted first
+_SPECIES_INSERTION_ORDER: Tuple[NitrogenSpecies, ...] = tuple(
+    sorted(
+        NitrogenSpecies,
+        key=lambda s: NitrogenSpecies.get_num_carbon_atoms_to_remove(s)
+        and NitrogenSpecies.get_num_nitrogen_atoms_to_add(s),
+        reverse=True,
+    )
+)
+
 
 @dataclass
 class DopingStructure:
@@ -258,12 +527,29 @@ class DopingStructure:
         -------
         DopingStructure
             The created doping structure.
+
+        Raises
+        ------
+        ValueError
+            If no cycle with at most the expected number of atoms for the species includes all structure-building
+            neighbors.
         """
 
         graph = structure.graph
 
         # Detect the cycle and create the subgraph
-        cycle, subgraph = cls._detect_cycle_and_subgraph(graph, structural_components.structure_building_neighbors)
+        max_cycle_length = NitrogenSpecies.get_cycle_length(species)
+        cycle, subgraph = cls._detect_cycle_and_subgraph(
+            graph, structural_components.structure_building_neighbors, max_cycle_length
+        )
+
+        # The cycle search stops beyond the expected cycle length; raise an error instead of continuing with an empty
+        # cycle
+        if not cycle:
+            raise ValueError(
+                f"No cycle of at most {max_cycle_length} atoms including the structure-building neighbors "
+                f"{structural_components.structure_building_neighbors} was found for species {species.value}."
+            )
 
         # Order the cycle
         ordered_cycle = cls._order_cycle(subgraph, cycle, species, start_node)
@@ -293,7 +579,9 @@ class DopingStructure:
         )
 
     @staticmethod
-    def _detect_cycle_and_subgraph(graph: nx.Graph, neighbors: List[int]) -> Tuple[List[int], nx.Graph]:
+    def _detect_cycle_and_subgraph(
+        graph: nx.Graph, neighbors: List[int], max_cycle_length: Optional[int] = None
+    ) -> Tuple[List[int], nx.Graph]:
         """
         Detect the cycle including the given neighbors and create the corresponding subgraph.
 
@@ -303,6 +591,9 @@ class DopingStructure:
             The graph containing the cycle.
         neighbors : List[int]
             List of neighbor atom IDs.
+        max_cycle_length : Optional[int], optional
+            The maximum expected number of atoms in the cycle, used to stop the cycle search early. Default is None
+            (no limit).
 
         Returns
         -------
@@ -311,7 +602,7 @@ class DopingStructure:
         """
 
         # Find the shortest cycle that includes all the given neighbors
-        cycle = DopingStructure._find_min_cycle_including_neighbors(graph, neighbors)
+        cycle = DopingStructure._find_min_cycle_including_neighbors(graph, neighbors, max_cycle_length)
 
         # Create a subgraph from the detected cycle
         subgraph = graph.subgraph(cycle).copy()
@@ -345,38 +636,18 @@ class DopingStructure:
 
         graph = structure.graph
 
-        # Remove the start node from the list of neighbors to get the two neighbors to connect
-        neighbors.remove(start_node)
-
-        # Get the positions of the two remaining neighbors
-        pos1 = graph.nodes[neighbors[0]]["position"]
-        pos2 = graph.nodes[neighbors[1]]["position"]
-
-        # if isinstance(structure, GrapheneSheet):
-        if hasattr(structure, "actual_sheet_width") and hasattr(structure, "actual_sheet_height"):
-            # Calculate the box size for periodic boundary conditions
-            box_size = (
-                structure.actual_sheet_width + structure.c_c_bond_length,
-                structure.actual_sheet_height + structure.cc_y_distance,
-                0.0,
-            )
+        # Get the two neighbors to connect (all neighbors except the start node); the given list is left unchanged, as
+        # it belongs to the structural components of the doping structure
+        node_a, node_b = (neighbor for neighbor in neighbors if neighbor != start_node)
 
-            # Calculate the bond length between the two neighbors considering minimum image distance
-            bond_length, _ = minimum_image_distance(pos1, pos2, box_size)
-
-            # Add the edge to the main graph and the subgraph with the bond length
-            graph.add_edge(neighbors[0], neighbors[1], bond_length=bond_length)
-            subgraph.add_edge(neighbors[0], neighbors[1], bond_length=bond_length)
-        else:
-            # ToDo: If the position adjustment is then also to be performed for the 3D structures, an alternative for
-            #  the 'minimum_image_distance' function must be found here in order to calculate the bond_length for
-            #  structures that are connected via the periodic edges
-            # For CNT or other 3D structures, add the edge without bond length calculation
-            graph.add_edge(neighbors[0], neighbors[1])
-            subgraph.add_edge(neighbors[0], neighbors[1])
+        # Add the edge to the main graph and the subgraph. The bond length of the edge is assigned afterwards for all
+        # PYRIDINIC_1 structures at once (see DopingHandler._assign_additional_edge_bond_lengths), as it is only needed
+        # once all structures are inserted
+        graph.add_edge(node_a, node_b)
+        subgraph.add_edge(node_a, node_b)
 
         # Return the nodes between which the edge was added
-        return neighbors[0], neighbors[1]
+        return node_a, node_b
 
     @staticmethod
     def _order_cycle(
@@ -411,6 +682,9 @@ class DopingStructure:
         current_node = start_node
         visited = set()
 
+        # Bind the adjacency of the subgraph once; it only contains the cycle nodes, so no extra cycle filter is needed
+        adjacency = subgraph.adj
+
         # Continue ordering nodes until all nodes in the cycle are included
         while len(ordered_cycle) < len(cycle):
             # Add the current node to the ordered list and mark it as visited
@@ -418,7 +692,7 @@ class DopingStructure:
             visited.add(current_node)
 
             # Find the neighbors of the current node that are in the cycle and not yet visited
-            neighbors = [node for node in subgraph.neighbors(current_node) if node not in visited]
+            neighbors = [node for node in adjacency[current_node] if node not in visited]
 
             # If there are unvisited neighbors, move to the next neighbor; otherwise, break the loop
             if neighbors:
@@ -428,7 +702,9 @@ class DopingStructure:
         return ordered_cycle
 
     @staticmethod
-    def _find_min_cycle_including_neighbors(graph: nx.Graph, neighbors: List[int]) -> List[int]:
+    def _find_min_cycle_including_neighbors(
+        graph: nx.Graph, neighbors: List[int], max_cycle_length: Optional[int] = None
+    ) -> List[int]:
         """
         Find the shortest cycle in the graph that includes all the given neighbors.
 
@@ -443,6 +719,10 @@ class DopingStructure:
             The whole graphene sheet graph.
         neighbors : List[int]
             A list of nodes that should be included in the cycle.
+        max_cycle_length : Optional[int], optional
+            The maximum number of atoms the cycle can have. Every atom of such a cycle is at most
+            `max_cycle_length // 2` bonds away from the given neighbors, so the search is stopped once the subgraph has
+            been expanded beyond that depth. Default is None (no limit).
 
         Returns
         -------
@@ -450,17 +730,21 @@ class DopingStructure:
             The shortest cycle that includes all the given neighbors, if such a cycle exists. Otherwise, an empty list.
         """
 
-        # Initialize the subgraph with the neighbors
+        # Read-only adjacency of the whole graph; neighbor lookups on it avoid building an edge view per node
+        adj = graph.adj
+
+        # Initialize the subgraph with the neighbors and add the edges of all neighbors in one batch
         subgraph = nx.Graph()
         subgraph.add_nodes_from(neighbors)
-
-        # Add edges from each neighbor to the subgraph
-        for node in neighbors:
-            subgraph.add_edges_from(graph.edges(node))
+        subgraph.add_edges_from((node, neighbor) for node in neighbors for neighbor in adj[node])
 
         # Keep track of visited edges to avoid unwanted cycles
         visited_edges: Set[Tuple[int, int]] = set(subgraph.edges)
 
+        # Maximum number of expansion steps (the initial subgraph already covers depth 1 around the neighbors)
+        max_depth = max_cycle_length // 2 if max_cycle_length else None
+        depth = 1
+
         # Expand the subgraph until the cycle is found
         while True:
             # Find all cycles in the current subgraph
@@ -470,10 +754,13 @@ class DopingStructure:
                 if all(neighbor in cycle for neighbor in neighbors):
                     return cycle
 
+            # Stop if the cycle would have to be longer than the maximum cycle length
+            if max_depth is not None and depth >= max_depth:
+                return []
+            depth += 1
+
             # If no cycle is found, expand the subgraph by adding neighbors of the current subgraph
-            new_edges: Set[Tuple[int, int]] = set()
-            for node in subgraph.nodes:
-                new_edges.update(graph.edges(node))
+            new_edges: Set[Tuple[int, int]] = {(node, neighbor) for node in subgraph.nodes for neighbor in adj[node]}
 
             # Only add new edges that haven't been visited
             new_edges.difference_update(visited_edges)
@@ -510,16 +797,19 @@ class DopingStructure:
 
         start_node = None
         if species in {NitrogenSpecies.PYRIDINIC_4, NitrogenSpecies.PYRIDINIC_3}:
+            # Look up the element of each cycle node once; the subgraph only contains the cycle nodes, so its adjacency
+            # only yields neighbors within the cycle
+            elements = dict(subgraph.nodes(data="element"))
+            adjacency = subgraph.adj
+
             # Find the starting node that has no "N" neighbors within the cycle and is not "N" itself
-            for node in subgraph.nodes:
+            for node, element in elements.items():
                 # Skip the node if it is already a nitrogen atom
-                if subgraph.nodes[node]["element"] == "N":
+                if element == "N":
                     continue
-                # Get the neighbors of the current node
-                neighbors = get_neighbors_via_edges(subgraph, node)
                 # Check if none of the neighbors of the node are nitrogen atoms, provided the neighbor is within the
                 # cycle
-                if all(subgraph.nodes[neighbor]["element"] != "N" for neighbor in neighbors):
+                if all(elements[neighbor] != "N" for neighbor in adjacency[node]):
                     # If the current node meets all conditions, set it as the start node
                     start_node = node
                     break
@@ -545,10 +835,11 @@ class DopingStructure:
         List[int]
             The list of neighboring atom IDs ordered based on their connection to the ordered cycle.
         """
+        cycle_set = set(ordered_cycle)
         neighboring_atoms = []
         for node in ordered_cycle:
             # Get the neighbor of the node that is not in the cycle
-            neighbor_without_cycle = [neighbor for neighbor in graph.neighbors(node) if neighbor not in ordered_cycle]
+            neighbor_without_cycle = [neighbor for neighbor in graph.neighbors(node) if neighbor not in cycle_set]
             neighboring_atoms.extend(neighbor_without_cycle)
         return neighboring_atoms
 
@@ -566,10 +857,39 @@ class DopingStructureCollection:
         Dictionary mapping nitrogen species to lists of chosen atom IDs. This is used to keep track of atoms that have
         already been chosen for doping (i.e., replaced by nitrogen atoms) to track the percentage of doping for each
         species.
+    structures_by_species : Dict[NitrogenSpecies, List[DopingStructure]]
+        Dictionary mapping nitrogen species to the doping structures of that species (in insertion order), so that the
+        structures of one species can be looked up without scanning the whole collection. It is built from the
+        structures passed to the constructor, rebuilt whenever `structures` is reassigned and extended by
+        `add_structure`.
     """
 
     structures: List[DopingStructure] = field(default_factory=list)
     chosen_atoms: Dict[NitrogenSpecies, List[int]] = field(default_factory=lambda: defaultdict(list))
+    structures_by_species: Dict[NitrogenSpecies, List[DopingStructure]] = field(
+        init=False, repr=False, default_factory=lambda: defaultdict(list)
+    )
+
+    def __post_init__(self):
+        # Index the structures passed to the constructor
+        self._index_structures()
+
+    def __setattr__(self, name, value):
+        super().__setattr__(name, value)
+        # Keep the per-species index in sync if the list of structures is replaced (the index does not exist yet while
+        # the constructor assigns the fields; it is built in __post_init__)
+        if name == "structures" and "structures_by_species" in self.__dict__:
+            self._index_structures()
+
+    def _index_structures(self):
+        """
+        Rebuild the mapping of nitrogen species to doping structures from the list of structures.
+        """
+
+        structures_by_species = defaultdict(list)
+        for doping_structure in self.structures:
+            structures_by_species[doping_structure.species].append(doping_structure)
+        self.structures_by_species = structures_by_species
 
     def add_structure(self, doping_structure: DopingStructure):
         """
@@ -577,6 +897,7 @@ class DopingStructureCollection:
         """
 
         self.structures.append(doping_structure)
+        self.structures_by_species[doping_structure.species].append(doping_structure)
         self.chosen_atoms[doping_structure.species].extend(doping_structure.nitrogen_atoms)
 
     def get_structures_for_species(self, species: NitrogenSpecies) -> List[DopingStructure]:
@@ -594,7 +915,7 @@ class DopingStructureCollection:
             A list of doping structures for the specified species.
         """
 
-        return [structure for structure in self.structures if structure.species == species]
+        return list(self.structures_by_species.get(species, ()))
 
     def __iter__(self):
         return iter(self.structures)
@@ -615,9 +936,14 @@ class DopingHandler:
 
         # Initialize the list of possible carbon atoms
         self._possible_carbon_atoms_needs_update = True
-        """Flag to indicate that the list of possible carbon atoms needs to be updated."""
-        self._possible_carbon_atoms = []
-        """List of possible carbon atoms that can be used for nitrogen doping."""
+        """Flag to indicate that the possible carbon atoms need to be rebuilt from the graph (e.g., after the structure
+        was modified outside the doping handler)."""
+        self._possible_carbon_atoms: Optional[List[int]] = None
+        """List of possible carbon atoms that can be used for nitrogen doping (in graph node order). It is derived from
+        the set of possible carbon atoms when needed and None if it has to be derived again."""
+        self._possible_carbon_atom_set: Set[int] = set()
+        """Set of the possible carbon atoms for constant time membership checks. Atoms excluded by the doping handler
+        are removed from it directly."""
 
         self.species_properties = self._initialize_species_properties()
         """A dictionary mapping each NitrogenSpecies to its corresponding NitrogenSpeciesProperties.
@@ -627,278 +953,87 @@ class DopingHandler:
         """A dataclass to store information about doping structures in the carbon structure."""
 
     @property
-    def possible_carbon_atoms(self):
+    def possible_carbon_atoms(self) -> List[int]:
         """Get the list of possible carbon atoms for doping."""
         if self._possible_carbon_atoms_needs_update:
             self._update_possible_carbon_atoms()
+        if self._possible_carbon_atoms is None:
+            possible_carbon_atom_set = self._possible_carbon_atom_set
+            self._possible_carbon_atoms = [node for node in self.graph if node in possible_carbon_atom_set]
         return self._possible_carbon_atoms
 
+    @property
+    def possible_carbon_atom_set(self) -> Set[int]:
+        """Get the set of possible carbon atoms for doping."""
+        if self._possible_carbon_atoms_needs_update:
+            self._update_possible_carbon_atoms()
+        return self._possible_carbon_atom_set
+
     def _update_possible_carbon_atoms(self):
-        """Update the list of possible carbon atoms for doping."""
+        """Update the list and the set of possible carbon atoms for doping."""
         self._possible_carbon_atoms = [
             node for node, data in self.graph.nodes(data=True) if data.get("possible_doping_site")
         ]
+        self._possible_carbon_atom_set = set(self._possible_carbon_atoms)
         self._possible_carbon_atoms_needs_update = False
 
     def mark_possible_carbon_atoms_for_update(self):
         """Mark the list of possible carbon atoms as needing an update."""
         self._possible_carbon_atoms_needs_update = True
 
+    def _exclude_from_possible_carbon_atoms(self, atoms: List[int]):
+        """
+        Exclude the given atoms from further doping.
+
+        The atoms are marked as no longer possible doping sites in the graph (atoms that were removed from the graph are
+        skipped) and discarded from the set of possible carbon atoms, so that the set does not have to be rebuilt from
+        the whole graph after every inserted doping structure.
+
+        Parameters
+        ----------
+        atoms : List[int]
+            The IDs of the atoms to exclude.
+        """
+        nx.set_node_attributes(self.graph, dict.fromkeys(atoms, False), "possible_doping_site")
+        self._possible_carbon_atom_set.difference_update(atoms)
+        self._possible_carbon_atoms = None
+
     @staticmethod
     def _initialize_species_properties() -> Dict[NitrogenSpecies, NitrogenSpeciesProperties]:
-        # Initialize properties for PYRIDINIC_4 nitrogen species with target bond lengths and angles
-        pyridinic_4_properties = NitrogenSpeciesProperties(
-            target_bond_lengths_cycle=[
-                1.45,
-                1.34,
-                1.32,
-                1.47,
-                1.32,
-                1.34,
-                1.45,
-                1.45,
-                1.34,
-                1.32,
-                1.47,
-                1.32,
-                1.34,
-                1.45,
-            ],
-            target_angles_cycle=[
-                120.26,
-                121.02,
-                119.3,
-                119.3,
-                121.02,
-                120.26,
-                122.91,
-                120.26,
-                121.02,
-                119.3,
-                119.3,
-                121.02,
-                120.26,
-                122.91,
-            ],
-            target_bond_lengths_neighbors=[
-                1.43,
-                1.43,
-                1.42,
-                1.42,
-                1.43,
-                1.43,
-                1.43,
-                1.42,
-                1.42,
-                1.43,
-            ],
-            target_angles_neighbors=[
-                118.54,
-                118.54,
-                118.86,
-                120.88,
-                122.56,
-                118.14,
-                118.14,
-                122.56,
-                120.88,
-                118.86,
-                118.54,
-                118.54,
-                118.86,
-                120.88,
-                122.56,
-                118.14,
-                118.14,
-                122.56,
-                120.88,
-                118.86,
-            ],
-        )
-        # Initialize properties for PYRIDINIC_3 nitrogen species with target bond lengths and angles
-        pyridinic_3_properties = NitrogenSpeciesProperties(
-            target_bond_lengths_cycle=[1.45, 1.33, 1.33, 1.45, 1.45, 1.33, 1.33, 1.45, 1.45, 1.33, 1.33, 1.45],
-            target_angles_cycle=[
-                120.00,
-                122.17,
-                120.00,
-                122.21,
-                120.00,
-                122.17,
-                120.00,
-                122.21,
-                120.00,
-                122.17,
-                120.00,
-                122.21,
-            ],
-            target_bond_lengths_neighbors=[
-                1.42,
-                1.43,
-                1.43,
-                1.42,
-                1.43,
-                1.43,
-                1.42,
-                1.43,
-                1.43,
-            ],
-            target_angles_neighbors=[
-                118.88,
-                118.88,
-                118.92,
-                121.10,
-                121.10,
-                118.92,
-                118.88,
-                118.88,
-                118.92,
-                121.10,
-                121.10,
-                118.92,
-                118.88,
-                118.88,
-                118.92,
-                121.10,
-                121.10,
-                118.92,
-            ],
-        )
-        # Initialize properties for PYRIDINIC_2 nitrogen species with target bond lengths and angles
-        pyridinic_2_properties = NitrogenSpeciesProperties(
-            target_bond_lengths_cycle=[1.39, 1.42, 1.42, 1.33, 1.35, 1.44, 1.44, 1.35, 1.33, 1.42, 1.42, 1.39],
-            target_angles_cycle=[
-                125.51,
-                118.04,
-                117.61,
-                120.59,
-                121.71,
-                122.14,
-                121.71,
-                120.59,
-                117.61,
-                118.04,
-                125.51,
-                125.04,
-            ],
-            target_bond_lengths_neighbors=[
-                1.45,
-                1.41,
-                1.41,
-                1.44,
-                1.44,
-                1.44,
-                1.41,
-                1.41,
-                1.45,
-            ],
-            target_angles_neighbors=[
-                116.54,
-                117.85,
-                121.83,
-                120.09,
-                119.20,
-                123.18,
-                119.72,
-                118.55,
-                118.91,
-                118.91,
-                118.55,
-                119.72,
-                123.18,
-                119.20,
-                120.09,
-                121.83,
-                117.85,
-                116.54,
-            ],
-        )
-        # Initialize properties for PYRIDINIC_1 nitrogen species with target bond lengths and angles
-        pyridinic_1_properties = NitrogenSpeciesProperties(
-            target_bond_lengths_cycle=[1.31, 1.42, 1.45, 1.51, 1.42, 1.40, 1.40, 1.42, 1.51, 1.45, 1.42, 1.31, 1.70],
-            target_angles_cycle=[
-                115.48,
-                118.24,
-                128.28,
-                109.52,
-                112.77,
-                110.35,
-                112.77,
-                109.52,
-                128.28,
-                118.24,
-                115.48,
-                120.92,
-            ],
-            target_bond_lengths_neighbors=[
-                1.41,
-                1.42,
-                1.48,
-                1.41,
-                1.38,
-                1.41,
-                1.48,
-                1.42,
-                1.41,
-            ],
-            target_angles_neighbors=[
-                121.99,
-                122.51,
-                115.67,
-                126.09,
-                111.08,
-                120.63,
-                131.00,
-                116.21,
-                124.82,
-                124.82,
-                116.21,
-                131.00,
-                120.63,
-                111.08,
-                126.09,
-                115.67,
-                122.51,
-                121.99,
-            ],
-            target_angles_additional_angles=[
-                148.42,
-                102.06,
-                102.06,
-                148.42,
-            ],
-        )
-        # graphitic_properties = NitrogenSpeciesProperties(
-        #     target_bond_lengths=[1.42],
-        #     target_angles=[120.0],
-        # )
-
-        # Initialize a dictionary mapping each NitrogenSpecies to its corresponding properties
-        species_properties = {
-            NitrogenSpecies.PYRIDINIC_4: pyridinic_4_properties,
-            NitrogenSpecies.PYRIDINIC_3: pyridinic_3_properties,
-            NitrogenSpecies.PYRIDINIC_2: pyridinic_2_properties,
-            NitrogenSpecies.PYRIDINIC_1: pyridinic_1_properties,
-            # NitrogenSpecies.GRAPHITIC: graphitic_properties,
-        }
-        return species_properties
+        """
+        Get the species properties for a new DopingHandler.
+
+        The target values are defined once at module level (NITROGEN_SPECIES_PROPERTIES). Each handler gets shallow
+        copies of the property instances, so that reassigning an attribute on one handler does not affect others.
+
+        Returns
+        -------
+        Dict[NitrogenSpecies, NitrogenSpeciesProperties]
+            A dictionary mapping each NitrogenSpecies to its corresponding NitrogenSpeciesProperties.
+        """
+        return {species: replace(properties) for species, properties in NITROGEN_SPECIES_PROPERTIES.items()}
 
     @staticmethod
-    def get_next_possible_carbon_atom(possible_carbon_atoms, tested_atoms):
+    def get_next_possible_carbon_atom(possible_carbon_atoms: List[int], tested_atoms: Set[int]) -> Optional[int]:
         """
         Get a randomly selected carbon atom from the list of possible carbon atoms that hasn't been tested yet.
 
         Parameters
         ----------
-        possible_carbon_atoms : list
+        possible_carbon_atoms : List[int]
             The list of possible carbon atoms to select from.
-        tested_atoms : set
+        tested_atoms : Set[int]
             A set of atom IDs that have already been tested.
 
         Returns
         -------
         int or None
             The ID of the selected carbon atom, or None if all atoms have been tested.
+
+        Notes
+        -----
+        The untested atoms are collected anew for every draw. This keeps the atoms drawn for a given random seed, and
+        thereby the seeded reference structures used in the tests, stable.
         """
         untested_atoms = list(set(possible_carbon_atoms) - tested_atoms)
         if not untested_atoms:
@@ -1169,7 +1304,7 @@ class DopingHandler:
                 num_atoms_remaining = num_initial_atoms
 
             # Remaining percentage
-            remaining_percentage = total_percentage - sum(percentages.values())
+            remaining_percentage = total_percentage - specific_total_percentage
 
             # Use optimization for remaining percentages
             desired_structures_remaining = self._calculate_num_desired_structures_using_linear_programming(
@@ -1484,17 +1619,11 @@ class DopingHandler:
         other C atoms with N atoms, and possibly adding new bonds between atoms (in the case of Pyridinic_1). After
         the structure is inserted, all atoms of this structure are excluded from further doping positions.
         """
-        # Sort the species by the number of removed carbon atoms as well as the number of contributing nitrogen atoms in
-        # decreasing order to insert larger structures first
-        species_sorted_by_size = sorted(
-            desired_structures.keys(),
-            key=lambda s: NitrogenSpecies.get_num_carbon_atoms_to_remove(s)
-            and NitrogenSpecies.get_num_nitrogen_atoms_to_add(s),
-            reverse=True,
-        )
-
-        for species in species_sorted_by_size:
-            num_structures = desired_structures.get(species, 0)
+        # Insert larger structures first, following the precomputed species order
+        for species in _SPECIES_INSERTION_ORDER:
+            if species not in desired_structures:
+                continue
+            num_structures = desired_structures[species]
             num_structures_inserted = self._attempt_insertion_for_species(species, num_structures)
 
             # Warn if not all requested structures could be placed due to space constraints
@@ -1505,6 +1634,58 @@ class DopingHandler:
                     UserWarning,
                 )
 
+        # Assign the bond lengths of the additional PYRIDINIC_1 edges in one batch
+        self._assign_additional_edge_bond_lengths()
+
+    def _assign_additional_edge_bond_lengths(self):
+        """
+        Assign the bond lengths of all additional edges added for PYRIDINIC_1 doping in a single vectorized call.
+
+        Notes
+        -----
+        The bond lengths are calculated considering the minimum image distance, which requires the box size of the
+        structure. For structures without a sheet size (e.g., CNTs), the edges are left without a bond length.
+        Edges that already carry a bond length (from a previous doping pass) are skipped.
+        """
+        structure = self.carbon_structure
+        if not (hasattr(structure, "actual_sheet_width") and hasattr(structure, "actual_sheet_height")):
+            # ToDo: If the position adjustment is then also to be performed for the 3D structures, an alternative for
+            #  the minimum image distance must be found here in order to calculate the bond_length for structures that
+            #  are connected via the periodic edges
+            return
+
+        # Collect all structures whose additional edge does not have a bond length yet
+        doping_structures = [
+            doping_structure
+            for doping_structure in self.doping_structures.get_structures_for_species(NitrogenSpecies.PYRIDINIC_1)
+            if doping_structure.additional_edge is not None
+            and "bond_length" not in self.graph.edges[doping_structure.additional_edge]
+        ]
+        if not doping_structures:
+            return
+        edges = [doping_structure.additional_edge for doping_structure in doping_structures]
+
+        # Gather the (x, y) positions of both edge ends
+        positions_i = np.array([self.graph.nodes[i]["position"][:2] for i, _ in edges], dtype=np.float64)
+        positions_j = np.array([self.graph.nodes[j]["position"][:2] for _, j in edges], dtype=np.float64)
+
+        # Calculate the box size for periodic boundary conditions
+        box_size = (
+            structure.actual_sheet_width + structure.c_c_bond_length,
+            structure.actual_sheet_height + structure.cc_y_distance,
+        )
+
+        # Calculate all bond lengths considering the minimum image distance and write them to the graph
+        bond_lengths, _ = minimum_image_distance_vectorized(positions_i, positions_j, box_size)
+        nx.set_edge_attributes(
+            self.graph, {edge: float(length) for edge, length in zip(edges, bond_lengths)}, name="bond_length"
+        )
+
+        # Also store the bond lengths on the subgraphs of the doping structures, which hold their own copy of the edge
+        for doping_structure, bond_length in zip(doping_structures, bond_lengths):
+            if doping_structure.subgraph is not None:
+                doping_structure.subgraph.edges[doping_structure.additional_edge]["bond_length"] = float(bond_length)
+
     def _attempt_insertion_for_species(self, species: NitrogenSpecies, num_structures: int):
         """
         Insert a specific number of doping structures for a given species.
@@ -1583,17 +1764,10 @@ class DopingHandler:
         neighbors = structural_components.structure_building_neighbors
 
         # Update the selected atom's element to nitrogen and set its nitrogen species
-        self.graph.nodes[atom_id]["element"] = "N"
-        self.graph.nodes[atom_id]["nitrogen_species"] = NitrogenSpecies.GRAPHITIC
+        self.graph.nodes[atom_id].update(element="N", nitrogen_species=NitrogenSpecies.GRAPHITIC)
 
-        # Mark this atom as no longer a possible doping site
-        self.graph.nodes[atom_id]["possible_doping_site"] = False
-        # Iterate through each neighbor and mark them as no longer possible doping sites
-        for neighbor in neighbors:
-            self.graph.nodes[neighbor]["possible_doping_site"] = False
-
-        # Flag to indicate that the list of possible carbon atoms needs to be updated
-        self.mark_possible_carbon_atoms_for_update()
+        # Mark the selected atom and its neighbors as no longer possible doping sites
+        self._exclude_from_possible_carbon_atoms([atom_id, *neighbors])
 
         # Create the doping structure
         doping_structure = DopingStructure(
@@ -1623,7 +1797,7 @@ class DopingHandler:
         # Remove the carbon atom(s) specified in the structural components from the graph
         for atom in structural_components.structure_building_atoms:
             self.graph.remove_node(atom)  # Remove the atom from the graph
-            # Note: The possible_carbon_atoms list is updated later to ensure synchronization with the graph
+            # Note: The possible carbon atoms are updated once the doping structure has been created
 
         # Determine the start node based on the species-specific logic; this is used to order the cycle correctly to
         # ensure the bond lengths and angles are consistent with the target values
@@ -1645,12 +1819,11 @@ class DopingHandler:
         # Add the newly created doping structure to the collection for management and tracking
         self.doping_structures.add_structure(doping_structure)
 
-        # Mark all nodes involved in the newly formed cycle as no longer valid for further doping
-        for node in doping_structure.cycle:
-            self.graph.nodes[node]["possible_doping_site"] = False
-
-        # Update the list of possible carbon atoms since the doping structure may have affected several nodes and edges
-        self.mark_possible_carbon_atoms_for_update()
+        # Mark all nodes involved in the newly formed cycle as no longer valid for further doping and drop the removed
+        # atoms from the possible carbon atoms
+        self._exclude_from_possible_carbon_atoms(
+            [*structural_components.structure_building_atoms, *doping_structure.cycle]
+        )
 
     def _handle_species_specific_logic(self, nitrogen_species: NitrogenSpecies, neighbors: List[int]) -> Optional[int]:
         """
@@ -1678,8 +1851,8 @@ class DopingHandler:
         if nitrogen_species == NitrogenSpecies.PYRIDINIC_1:
             # For PYRIDINIC_1, replace one carbon atom with a nitrogen atom
             selected_neighbor = random.choice(neighbors)  # Randomly select one neighbor to replace with nitrogen
-            self.graph.nodes[selected_neighbor]["element"] = "N"  # Update the selected neighbor to nitrogen
-            self.graph.nodes[selected_neighbor]["nitrogen_species"] = nitrogen_species  # Set its nitrogen species
+            # Update the selected neighbor to nitrogen and set its nitrogen species
+            self.graph.nodes[selected_neighbor].update(element="N", nitrogen_species=nitrogen_species)
 
             # Identify the start node for this cycle as the selected neighbor
             start_node = selected_neighbor
@@ -1687,19 +1860,21 @@ class DopingHandler:
         elif nitrogen_species == NitrogenSpecies.PYRIDINIC_2:
             # For PYRIDINIC_2, replace two carbon atoms with nitrogen atoms
             selected_neighbors = random.sample(neighbors, 2)  # Randomly select two neighbors to replace with nitrogen
+            node_attributes = self.graph.nodes
             for neighbor in selected_neighbors:
-                self.graph.nodes[neighbor]["element"] = "N"  # Update the selected neighbors to nitrogen
-                self.graph.nodes[neighbor]["nitrogen_species"] = nitrogen_species  # Set their nitrogen species
+                # Update the selected neighbors to nitrogen and set their nitrogen species
+                node_attributes[neighbor].update(element="N", nitrogen_species=nitrogen_species)
 
-            # Identify the start node for this cycle using set difference
-            remaining_neighbor = (set(neighbors) - set(selected_neighbors)).pop()  # Find the remaining neighbor
-            start_node = remaining_neighbor  # The start node is the remaining neighbor
+            # Identify the start node for this cycle as the remaining neighbor; a linear scan over the three neighbors
+            # is cheaper than building two sets for the difference
+            start_node = next(neighbor for neighbor in neighbors if neighbor not in selected_neighbors)
 
         elif nitrogen_species == NitrogenSpecies.PYRIDINIC_3 or nitrogen_species == NitrogenSpecies.PYRIDINIC_4:
             # For PYRIDINIC_3 and PYRIDINIC_4, replace three and four carbon atoms respectively with nitrogen atoms
-            for neighbor in neighbors:
-                self.graph.nodes[neighbor]["element"] = "N"  # Update all neighbors to nitrogen
-                self.graph.nodes[neighbor]["nitrogen_species"] = nitrogen_species  # Set their nitrogen species
+            # Update all neighbors to nitrogen and set their nitrogen species in a single bulk update
+            nx.set_node_attributes(
+                self.graph, {neighbor: {"element": "N", "nitrogen_species": nitrogen_species} for neighbor in neighbors}
+            )
 
         return start_node  # Return the determined start node or None if not applicable
 
@@ -1738,8 +1913,8 @@ class DopingHandler:
             """
             Check if all provided neighbors are possible carbon atoms for doping.
 
-            This method verifies whether all neighbors are in the list of possible carbon atoms.
-            If any neighbor is not in the list, it indicates that the structure to be added would overlap with the cycle
+            This method verifies whether all neighbors are in the set of possible carbon atoms.
+            If any neighbor is not in the set, it indicates that the structure to be added would overlap with the cycle
             of an existing structure, which is not allowed.
 
             Parameters
@@ -1753,7 +1928,7 @@ class DopingHandler:
                 True if all neighbors are possible atoms for doping, False otherwise.
             """
 
-            return all(neighbor in self.possible_carbon_atoms for neighbor in neighbors)
+            return self.possible_carbon_atom_set.issuperset(neighbors)
 
         # # Get the next possible carbon atom to test for doping and its neighbors
         # atom_id = self.get_next_possible_carbon_atom(possible_carbon_atoms_to_test)
@@ -1775,13 +1950,9 @@ class DopingHandler:
 
         # Check the proximity constraints based on the nitrogen species
         if nitrogen_species == NitrogenSpecies.GRAPHITIC:
-            # Collect elements and nitrogen species of neighbors
-            neighbor_elements = [
-                (self.graph.nodes[neighbor]["element"], self.graph.nodes[neighbor].get("nitrogen_species"))
-                for neighbor in neighbors
-            ]
-            # Ensure all neighbors are not nitrogen atoms
-            if all(elem != "N" for elem, _ in neighbor_elements):
+            # Ensure all neighbors are not nitrogen atoms (stops at the first nitrogen neighbor found)
+            node_attributes = self.graph.nodes
+            if all(node_attributes[neighbor]["element"] != "N" for neighbor in neighbors):
                 # Return True if the position is valid for graphitic doping and the structural components
                 return True, StructuralComponents(
                     structure_building_atoms=[atom_id], structure_building_neighbors=neighbors
@@ -1814,7 +1985,12 @@ class DopingHandler:
             # Initialize some variables containing neighbor information
             selected_neighbor = None
             temp_neighbors = neighbors.copy()
-            combined_len_2_neighbors = []
+            combined_len_2_neighbors = set()
+
+            # Get neighbors up to depth 2 for the selected atom; they do not depend on the neighbor tried below
+            neighbors_len_2_atom = get_neighbors_via_edges(self.graph, atom_id, depth=2, inclusive=True)
+            # If not all of them are possible atoms for doping, no neighbor can complete a valid position
+            atom_neighbors_possible = all_neighbors_possible_carbon_atoms(neighbors_len_2_atom)
 
             # Iterate over the neighbors of the selected atom to find a direct neighbor that has a valid position
             while temp_neighbors and not selected_neighbor:
@@ -1822,16 +1998,21 @@ class DopingHandler:
                 temp_neighbor = random.choice(temp_neighbors)
                 temp_neighbors.remove(temp_neighbor)
 
-                # Get neighbors up to depth 2 for the selected atom and a neighboring atom (if provided)
-                neighbors_len_2_atom = get_neighbors_via_edges(self.graph, atom_id, depth=2, inclusive=True)
+                # Skip the depth-2 search if the selected atom already rules out a valid position; the neighbors are
+                # still drawn, so that seeded runs consume the random numbers in the same order
+                if not atom_neighbors_possible:
+                    continue
+
+                # Get neighbors up to depth 2 for the neighboring atom
                 neighbors_len_2_neighbor = get_neighbors_via_edges(self.graph, temp_neighbor, depth=2, inclusive=True)
 
-                # Combine the two lists and remove the atom_id
-                combined_len_2_neighbors = list(set(neighbors_len_2_atom + neighbors_len_2_neighbor))
-                # Ensure all neighbors (from both atoms) are possible atoms for doping
-                if all_neighbors_possible_carbon_atoms(combined_len_2_neighbors):
+                # Ensure all neighbors (from both atoms) are possible atoms for doping; the neighbors of the selected
+                # atom have already been checked above
+                if all_neighbors_possible_carbon_atoms(neighbors_len_2_neighbor):
                     # Valid neighbor found
                     selected_neighbor = temp_neighbor
+                    # Combine the neighbors of both atoms
+                    combined_len_2_neighbors = set(neighbors_len_2_atom).union(neighbors_len_2_neighbor)
 
             if selected_neighbor is None:
                 # Return False if no valid neighbor is found for pyridinic 4 doping
@@ -1931,10 +2112,11 @@ class DopingHandler:
         Update the actual doping percentages after adding additional structures.
         """
         total_atoms_after_doping = self.graph.number_of_nodes()
+        chosen_atoms = self.doping_structures.chosen_atoms
         actual_percentages = {
             species.value: (
                 round(
-                    (len(self.doping_structures.chosen_atoms.get(species, [])) / total_atoms_after_doping) * 100,
+                    (len(chosen_atoms.get(species, ())) / total_atoms_after_doping) * 100,
                     2,
                 )
                 if total_atoms_after_doping > 0
@@ -1950,7 +2132,7 @@ class DopingHandler:
             )
 
         # Recalculate total nitrogen and total doping percentage
-        total_nitrogen_atoms = sum(len(atoms) for atoms in self.doping_structures.chosen_atoms.values())
+        total_nitrogen_atoms = sum(len(atoms) for atoms in chosen_atoms.values())
         total_doping_percentage = round((total_nitrogen_atoms / total_atoms_after_doping) * 100, 2)
 
         return actual_percentages, total_doping_percentage
@@ -1963,9 +2145,8 @@ class DopingHandler:
         total_atoms_after_doping = self.graph.number_of_nodes()
 
         # Calculate nitrogen atom counts and actual percentages
-        nitrogen_atom_counts = {
-            species: len(self.doping_structures.chosen_atoms.get(species, [])) for species in NitrogenSpecies
-        }
+        chosen_atoms = self.doping_structures.chosen_atoms
+        nitrogen_atom_counts = {species: len(chosen_atoms.get(species, ())) for species in NitrogenSpecies}
         actual_percentages = {
             species.value: (round((count / total_atoms_after_doping) * 100, 2) if total_atoms_after_doping > 0 else 0)
             for species, count in nitrogen_atom_counts.items()
@@ -1980,18 +2161,34 @@ class DopingHandler:
             species: len(self.doping_structures.get_structures_for_species(species)) for species in NitrogenSpecies
         }
 
-        # Prepare the DataFrame
-        doping_results = {
-            "Nitrogen Species": [species.value for species in NitrogenSpecies] + ["Total Doping"],
-            "Actual Percentage": list(actual_percentages.values()) + [total_doping_percentage],
-            "Nitrogen Atom Count": list(nitrogen_atom_counts.values()) + [total_nitrogen_atoms],
-            "Doping Structure Count": list(doping_structure_counts.values()) + [sum(doping_structure_counts.values())],
-        }
-        doping_results_df = pd.DataFrame(doping_results)
-
-        # Set pandas display options to show all columns without truncation
-        pd.set_option("display.max_columns", None)  # Shows all columns
-        pd.set_option("display.width", None)  # Adjusts output to the screen width
+        # Prepare the rows of the results table (one row per species and a final row with the totals)
+        header = ("Nitrogen Species", "Actual Percentage", "Nitrogen Atom Count", "Doping Structure Count")
+        rows = [
+            (
+                species.value,
+                f"{actual_percentages[species.value]:.2f}",
+                str(nitrogen_atom_counts[species]),
+                str(doping_structure_counts[species]),
+            )
+            for species in NitrogenSpecies
+        ]
+        rows.append(
+            (
+                "Total Doping",
+                f"{total_doping_percentage:.2f}",
+                str(total_nitrogen_atoms),
+                str(sum(doping_structure_counts.values())),
+            )
+        )
 
+        # Print the table as plain text with all columns (species names left-aligned, numbers right-aligned); this
+        # avoids building a pandas DataFrame just to print a handful of values
+        column_widths = [max(len(row[column]) for row in (header, *rows)) for column in range(len(header))]
         print("\nDoping Results:")
-        print(doping_results_df)
+        for row in (header, *rows):
+            print(
+                "  ".join(
+                    value.ljust(width) if column == 0 else value.rjust(width)
+                    for column, (value, width) in enumerate(zip(row, column_widths))
+                )
+            )
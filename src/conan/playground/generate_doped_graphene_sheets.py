@@ -1,5 +1,6 @@
 import os
 import random
+from concurrent.futures import ProcessPoolExecutor
 from itertools import combinations
 from typing import Dict, List, Tuple
 
@@ -7,6 +8,25 @@ from conan.playground.doping import NitrogenSpecies
 from conan.playground.structures import GrapheneSheet
 from conan.playground.utils import write_xyz
 
+# Available nitrogen species
+_AVAILABLE_SPECIES = (
+    # NitrogenSpecies.GRAPHITIC,
+    NitrogenSpecies.PYRIDINIC_1,
+    NitrogenSpecies.PYRIDINIC_2,
+    NitrogenSpecies.PYRIDINIC_3,
+    NitrogenSpecies.PYRIDINIC_4,
+)
+
+# Possible combinations of species (from 1 to all species); they do not depend on the sheet, so they are built once
+_SPECIES_COMBINATIONS = tuple(
+    combination for r in range(1, len(_AVAILABLE_SPECIES) + 1) for combination in combinations(_AVAILABLE_SPECIES, r)
+)
+
+# # Filter out combinations with only GRAPHITIC_N
+# _SPECIES_COMBINATIONS = tuple(
+#     combo for combo in _SPECIES_COMBINATIONS if not (len(combo) == 1 and NitrogenSpecies.GRAPHITIC in combo)
+# )
+
 
 def create_graphene_sheets(
     num_sheets: int = 100,
@@ -14,6 +34,7 @@ def create_graphene_sheets(
     sheet_sizes: List[Tuple[int, int]] = None,
     write_to_file: bool = True,
     create_plots: bool = False,
+    n_jobs: int = 1,
 ):
     """
     Create a specified number of doped graphene sheets with varying sizes, total doping percentages, relative doping
@@ -31,11 +52,21 @@ def create_graphene_sheets(
         Whether to write the generated sheets to XYZ files. Default is True.
     create_plots : bool, optional
         Whether to create plots of the generated sheets and save them to the output folder. Default is False.
+    n_jobs : int, optional
+        Number of worker processes used to generate the sheets in parallel. Default is 1 (sequential generation).
 
     Returns
     -------
     List[GrapheneSheet]
         List of generated graphene sheets.
+
+    Notes
+    -----
+    The random parameters of all sheets and a seed for the doping of each sheet are drawn up front from the `random`
+    module. Every sheet is then doped with its own seed, so the generated sheets are reproducible for a given global
+    seed independent of the number of worker processes. The state of the `random` module is restored after the
+    up-front draws and after each sheet, so the caller's random stream is left unchanged. Calling the function again
+    without drawing from or reseeding the `random` module in between therefore creates the same sheets.
     """
     # Create the output folder if it does not exist
     if not os.path.exists(output_folder):
@@ -45,71 +76,30 @@ def create_graphene_sheets(
     if sheet_sizes is None:
         sheet_sizes = [(20, 20), (30, 30), (40, 40)]
 
-    # Available nitrogen species
-    available_species = [
-        # NitrogenSpecies.GRAPHITIC,
-        NitrogenSpecies.PYRIDINIC_1,
-        NitrogenSpecies.PYRIDINIC_2,
-        NitrogenSpecies.PYRIDINIC_3,
-        NitrogenSpecies.PYRIDINIC_4,
-    ]
-
-    # Generate possible combinations of species (from 1 to all species)
-    species_combinations = []
-    for r in range(1, len(available_species) + 1):
-        combinations_r = list(combinations(available_species, r))
-        species_combinations.extend(combinations_r)
-
-    # # Filter out combinations with only GRAPHITIC_N
-    # species_combinations = [
-    #     combo for combo in species_combinations if not (len(combo) == 1 and NitrogenSpecies.GRAPHITIC in combo)
-    # ]
-
-    generated_sheets = []
-
-    for i in range(num_sheets):
-        # Randomly select parameters
-        size = random.choice(sheet_sizes)
-        total_percentage = random.uniform(5.0, 15.0)  # Random doping percentage between 5% and 15%
-        species_combination = random.choice(species_combinations)
-
-        # Create a graphene sheet with the selected size
-        graphene = GrapheneSheet(bond_length=1.42, sheet_size=size)
-
-        # Generate percentages for each species in the combination
-        species_percentages = generate_species_percentages(species_combination, total_percentage)
-
-        # Add nitrogen doping
-        graphene.add_nitrogen_doping(
-            total_percentage=total_percentage, percentages=species_percentages, adjust_positions=False
-        )
-
-        # Append the generated sheet to the list
-        generated_sheets.append(graphene)
-
-        if write_to_file or create_plots:
-
-            # Generate an informative filename
-            size_str = f"{size[0]}x{size[1]}"
-            total_pct_str = f"{total_percentage:.1f}_percent"
-            species_percentage_str = "_".join(
-                [
-                    f"{species.value.replace(' ', '').replace('-', '')}_{percentage_per_species:.1f}_percent"
-                    for species, percentage_per_species in species_percentages.items()
-                ]
+    # Randomly select the parameters of all sheets and a seed for the doping of each sheet; the state of the random
+    # module is restored afterwards, so that the random stream of the caller is left unchanged
+    random_state = random.getstate()
+    sheet_parameters = []
+    try:
+        for i in range(num_sheets):
+            size = random.choice(sheet_sizes)
+            total_percentage = random.uniform(5.0, 15.0)  # Random doping percentage between 5% and 15%
+            species_combination = random.choice(_SPECIES_COMBINATIONS)
+            # Generate percentages for each species in the combination
+            species_percentages = generate_species_percentages(species_combination, total_percentage)
+            seed = random.getrandbits(32)
+            sheet_parameters.append(
+                (i, size, total_percentage, species_percentages, seed, output_folder, write_to_file, create_plots)
             )
-            base_filename = f"graphene_{i + 1}_{size_str}_{total_pct_str}_{species_percentage_str}"
-
-            if write_to_file:
-                # Save the graphene sheet as an XYZ file
-                file_name = os.path.join(output_folder, f"{base_filename}.xyz")
-                write_xyz(graphene.graph, file_name)
+    finally:
+        random.setstate(random_state)
 
-            if create_plots:
-                # Generate the plot filename
-                plot_file_name = os.path.join(output_folder, f"{base_filename}.png")
-                # Plot the structure and save the plot
-                graphene.plot_structure(True, False, plot_file_name)
+    # Create the sheets (the sheets are independent of each other, so they can be created in parallel)
+    if n_jobs == 1:
+        generated_sheets = [_create_doped_graphene_sheet(*parameters) for parameters in sheet_parameters]
+    else:
+        with ProcessPoolExecutor(max_workers=n_jobs) as executor:
+            generated_sheets = list(executor.map(_create_doped_graphene_sheet, *zip(*sheet_parameters)))
 
     print(
         f"\n{num_sheets} graphene sheets with varying sizes, nitrogen doping percentages, "
@@ -122,6 +112,126 @@ def create_graphene_sheets(
     return generated_sheets
 
 
+def _create_doped_graphene_sheet(
+    index: int,
+    size: Tuple[int, int],
+    total_percentage: float,
+    species_percentages: Dict[NitrogenSpecies, float],
+    seed: int,
+    output_folder: str,
+    write_to_file: bool,
+    create_plots: bool,
+) -> GrapheneSheet:
+    """
+    Create a single doped graphene sheet and optionally save it as an XYZ file and/or a plot.
+
+    This is a module-level function, so that it can be executed in worker processes by `create_graphene_sheets`.
+
+    Parameters
+    ----------
+    index : int
+        Index of the sheet, used in the file names.
+    size : Tuple[int, int]
+        The sheet size (width, height).
+    total_percentage : float
+        Total doping percentage.
+    species_percentages : Dict[NitrogenSpecies, float]
+        Dictionary mapping each species to its assigned percentage.
+    seed : int
+        Seed for the random number generator used during doping.
+    output_folder : str
+        Directory where the files are saved.
+    write_to_file : bool
+        Whether to write the sheet to an XYZ file.
+    create_plots : bool
+        Whether to create a plot of the sheet and save it to the output folder.
+
+    Returns
+    -------
+    GrapheneSheet
+        The generated graphene sheet.
+    """
+    # Seed the doping of this sheet; the doping draws from the global random module, so the state of the caller is saved
+    # here and restored afterwards, leaving the random stream of the calling process untouched
+    random_state = random.getstate()
+    random.seed(seed)
+    try:
+        return _dope_graphene_sheet(
+            index, size, total_percentage, species_percentages, output_folder, write_to_file, create_plots
+        )
+    finally:
+        random.setstate(random_state)
+
+
+def _dope_graphene_sheet(
+    index: int,
+    size: Tuple[int, int],
+    total_percentage: float,
+    species_percentages: Dict[NitrogenSpecies, float],
+    output_folder: str,
+    write_to_file: bool,
+    create_plots: bool,
+) -> GrapheneSheet:
+    """
+    Build and dope a single graphene sheet with the current state of the random module and optionally save it.
+
+    Parameters
+    ----------
+    index : int
+        Index of the sheet, used in the file names.
+    size : Tuple[int, int]
+        The sheet size (width, height).
+    total_percentage : float
+        Total doping percentage.
+    species_percentages : Dict[NitrogenSpecies, float]
+        Dictionary mapping each species to its assigned percentage.
+    output_folder : str
+        Directory where the files are saved.
+    write_to_file : bool
+        Whether to write the sheet to an XYZ file.
+    create_plots : bool
+        Whether to create a plot of the sheet and save it to the output folder.
+
+    Returns
+    -------
+    GrapheneSheet
+        The generated graphene sheet.
+    """
+    # Create a graphene sheet with the selected size
+    graphene = GrapheneSheet(bond_length=1.42, sheet_size=size)
+
+    # Add nitrogen doping
+    graphene.add_nitrogen_doping(
+        total_percentage=total_percentage, percentages=species_percentages, adjust_positions=False
+    )
+
+    if write_to_file or create_plots:
+
+        # Generate an informative filename
+        size_str = f"{size[0]}x{size[1]}"
+        total_pct_str = f"{total_percentage:.1f}_percent"
+        species_percentage_str = "_".join(
+            [
+                f"{species.value.replace(' ', '').replace('-', '')}_{percentage_per_species:.1f}_percent"
+                for species, percentage_per_species in species_percentages.items()
+            ]
+        )
+        base_filename = f"graphene_{index + 1}_{size_str}_{total_pct_str}_{species_percentage_str}"
+
+        if write_to_file:
+            # Save the graphene sheet as an XYZ file
+            file_name = os.path.join(output_folder, f"{base_filename}.xyz")
+            write_xyz(graphene.graph, file_name)
+
+        if create_plots:
+            # Generate the plot filename
+            plot_file_name = os.path.join(output_folder, f"{base_filename}.png")
+            # Plot the structure and save the plot
+            graphene.plot_structure(True, False, plot_file_name)
+
+    return graphene
+
+
 def generate_species_percentages(species_combination, total_percentage) -> Dict[NitrogenSpecies, float]:
     """
     Generate random percentages for each species in the combination, ensuring the total adds up to total_percentage.
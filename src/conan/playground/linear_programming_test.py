@@ -1,5 +1,9 @@
 import pulp
 
+# Use HiGHS if it is installed (faster on larger instances), otherwise fall back to CBC, which is shipped with PuLP. The
+# solver is selected once and reused for all problems solved below
+solver = pulp.HiGHS(msg=True) if "HiGHS" in pulp.listSolvers(onlyAvailable=True) else pulp.PULP_CBC_CMD(msg=True)
+
 # Define the initial parameters
 T_initial = 576  # Total initial atoms in the undoped sheet
 P_desired = 8.5  # Desired nitrogen percentage in the doped sheet
@@ -23,13 +27,13 @@ prob = pulp.LpProblem("Nitrogen_Doping_Optimization", pulp.LpMinimize)
 
 # Decision variables
 # Integer variable representing the number of doping structures of type i to insert
-xi = [pulp.LpVariable(f"x_{i}", lowBound=0, cat="Integer") for i in range(D)]
+xi = pulp.LpVariable.dicts("x", range(D), lowBound=0, cat="Integer")
 # Continuous variable representing the average number of nitrogen atoms per doping type
 N_avg = pulp.LpVariable("N_avg", lowBound=0, cat="Continuous")
 # di = [pulp.LpVariable(f"d_{i}", lowBound=0, cat="Continuous") for i in range(D)]
 # Continuous variables for positive and negative deviations of nitrogen atoms added by doping type i from N_avg
-P_di = [pulp.LpVariable(f"P_d_{i}", lowBound=0, cat="Continuous") for i in range(D)]
-N_di = [pulp.LpVariable(f"N_d_{i}", lowBound=0, cat="Continuous") for i in range(D)]
+P_di = pulp.LpVariable.dicts("P_d", range(D), lowBound=0, cat="Continuous")
+N_di = pulp.LpVariable.dicts("N_d", range(D), lowBound=0, cat="Continuous")
 # Continuous variables for positive and negative deviations (in nitrogen atom units) from the desired total nitrogen
 # atoms
 P = pulp.LpVariable("P_i", lowBound=0, cat="Continuous")
@@ -50,14 +54,15 @@ prob += w1 * z1 + w2 * z2, "Minimize total deviation"
 
 # Nitrogen percentage constraint (replacing upper and lower bound constraints) to ensure that the total effective
 # nitrogen contribution from all doping types matches the desired total nitrogen atoms (RHS), accounting for deviations
-# (P, N)
-prob += pulp.lpSum([ki[i] * xi[i] for i in range(D)]) + P - N == RHS, "Nitrogen deviation constraint"
+# (P, N). The weighted sums are built directly from (variable, coefficient) pairs instead of summing up products
+prob += pulp.LpAffineExpression([(xi[i], ki[i]) for i in range(D)]) + P - N == RHS, "Nitrogen deviation constraint"
 # Define z1 as the sum of positive and negative deviations, effectively capturing the absolute deviation in nitrogen
 # atoms
 prob += z1 == P + N, "Absolute deviation constraint"
 
-# Constraint to calculate the average number of nitrogen atoms added per doping type
-prob += N_avg == pulp.lpSum([ri[i] * xi[i] for i in range(D)]) / D, "Average nitrogen atoms constraint"
+# Constraint to calculate the average number of nitrogen atoms added per doping type (multiplied by D, so that all
+# coefficients are integers)
+prob += D * N_avg == pulp.LpAffineExpression([(xi[i], ri[i]) for i in range(D)]), "Average nitrogen atoms constraint"
 
 # # Constraints for deviations in nitrogen atoms from the average
 # for i in range(D):
@@ -75,7 +80,7 @@ for i in range(D):
 prob += z2 == pulp.lpSum([P_di[i] + N_di[i] for i in range(D)]), "Total deviation in nitrogen atoms"
 
 # Solve the problem
-prob.solve(pulp.PULP_CBC_CMD(msg=True))
+prob.solve(solver)
 
 # Retrieve the solution (optimized values of the variables from the solved model)
 xi_values = [int(xi[i].varValue) for i in range(D)]
@@ -88,12 +93,18 @@ N_di_values = [N_di[i].varValue for i in range(D)]
 z1_value = z1.varValue
 z2_value = z2.varValue
 
+# Compute actual atoms per species (reused for the printed results and the plots)
+actual_atoms_per_species = [ri[i] * xi_values[i] for i in range(D)]
+
 # Compute the actual nitrogen percentage
-N_total = sum([ri[i] * xi_values[i] for i in range(D)])  # Total  nitrogen atoms added
+N_total = sum(actual_atoms_per_species)  # Total  nitrogen atoms added
 C_removed = sum([ci[i] * xi_values[i] for i in range(D)])  # Total carbon atoms removed
 T_final = T_initial - C_removed  # Final total atoms
 P_actual = (N_total / T_final) * 100  # Actual nitrogen percentage
 
+# Compute actual percentages per species
+actual_percentages = [N_atom_count / T_final * 100 for N_atom_count in actual_atoms_per_species]
+
 # Convert the absolute deviation in the number of nitrogen atoms to a percentage deviation for easier interpretation
 z1_percentage = z1_value / (T_final / 100)
 
@@ -102,9 +113,9 @@ print("Doping Results:")
 print("|Nitrogen Species | Actual Percentage (%) | Nitrogen Atom Count | Doping Structure Count |")
 for i in range(D):
     species = names[i]
-    N_atom_count = ri[i] * xi_values[i]
+    N_atom_count = actual_atoms_per_species[i]
     doping_structure_count = xi_values[i]
-    actual_percentage = (N_atom_count / T_final) * 100
+    actual_percentage = actual_percentages[i]
     print(f"{i:<6}{species:<15}{actual_percentage:>17.2f}{N_atom_count:>22}{doping_structure_count:>25}")
 print(f"{'Total Doping':<21}{P_actual:>17.2f}{N_total:>22}{sum(xi_values):>25}")
 
@@ -118,11 +129,6 @@ print(f" - z2 (Deviation from Equal Distribution): {z2_value} atoms")
 import matplotlib.gridspec as gridspec
 import matplotlib.pyplot as plt
 
-# Compute actual percentages per species
-actual_percentages = [(ri[i] * xi_values[i] / T_final) * 100 for i in range(D)]
-# Compute actual atoms per species
-actual_atoms_per_species = [ri[i] * xi_values[i] for i in range(D)]
-
 # Create a figure with a specific size
 plt.figure(figsize=(14, 10))
 
@@ -186,10 +192,10 @@ RHS = P_desired_fraction * T_initial
 prob = pulp.LpProblem("Nitrogen_Doping_Optimization", pulp.LpMinimize)
 
 # Decision variables
-xi = [pulp.LpVariable(f"x_{i}", lowBound=0, cat="Integer") for i in range(D)]
+xi = pulp.LpVariable.dicts("x", range(D), lowBound=0, cat="Integer")
 N_avg = pulp.LpVariable("N_avg", lowBound=0, cat="Continuous")
-P_di = [pulp.LpVariable(f"P_d_{i}", lowBound=0, cat="Continuous") for i in range(D)]
-N_di = [pulp.LpVariable(f"N_d_{i}", lowBound=0, cat="Continuous") for i in range(D)]
+P_di = pulp.LpVariable.dicts("P_d", range(D), lowBound=0, cat="Continuous")
+N_di = pulp.LpVariable.dicts("N_d", range(D), lowBound=0, cat="Continuous")
 P = pulp.LpVariable("P_i", lowBound=0, cat="Continuous")
 N = pulp.LpVariable("N_i", lowBound=0, cat="Continuous")
 z1 = pulp.LpVariable("z1", lowBound=0, cat="Continuous")
@@ -204,11 +210,14 @@ w2 = 1  # Weight for deviation from equal distribution of nitrogen atoms
 prob += w1 * z1 + w2 * z2, "Minimize total deviation"
 
 # Nitrogen percentage constraint
-prob += pulp.lpSum([ki[i] * xi[i] for i in range(D)]) + P - N == RHS, "Nitrogen deviation constraint"
+prob += pulp.LpAffineExpression([(xi[i], ki[i]) for i in range(D)]) + P - N == RHS, "Nitrogen deviation constraint"
 prob += z1 == P + N, "Absolute deviation constraint"
 
-# Average nitrogen atoms constraint
-prob += N_avg == pulp.lpSum([ri[i] * xi[i] for i in range(D)]) / D, "Average nitrogen atoms constraint"
+# Total nitrogen atoms added by all doping structures (built once, as it is used in several constraints)
+N_total_expr = pulp.LpAffineExpression([(xi[i], ri[i]) for i in range(D)])
+
+# Average nitrogen atoms constraint (multiplied by D to keep integer coefficients)
+prob += D * N_avg == N_total_expr, "Average nitrogen atoms constraint"
 
 # Constraints for deviations in nitrogen atoms from the average
 for i in range(D):
@@ -217,10 +226,10 @@ for i in range(D):
 prob += z2 == pulp.lpSum([P_di[i] + N_di[i] for i in range(D)]), "Total deviation in nitrogen atoms"
 
 # New constraint to enforce evenness of total nitrogen atoms
-prob += pulp.lpSum([ri[i] * xi[i] for i in range(D)]) - 2 * y == 0, "Evenness constraint"
+prob += N_total_expr - 2 * y == 0, "Evenness constraint"
 
 # Solve the problem
-prob.solve(pulp.PULP_CBC_CMD(msg=True))
+prob.solve(solver)
 
 # Retrieve the solution
 xi_values = [int(xi[i].varValue) for i in range(D)]
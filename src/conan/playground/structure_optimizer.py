@@ -1,4 +1,4 @@
-from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
 
 if TYPE_CHECKING:  # pragma: no cover
     from conan.playground.structures import MaterialStructure
@@ -7,9 +7,9 @@ if TYPE_CHECKING:  # pragma: no cover
 from dataclasses import dataclass
 from itertools import pairwise
 
-import networkx as nx
 import numpy as np
 import numpy.typing as npt
+from numba import jit
 from scipy.optimize import minimize
 from tqdm import tqdm
 
@@ -67,6 +67,235 @@ class OptimizationConfig:
                 raise ValueError(f"{attr_name} must be positive. Got {value}.")
 
 
+@jit(nopython=True, cache=True)
+def _bond_strain_and_gradient_kernel(
+    positions: npt.NDArray[np.float64],
+    idx_i_array: npt.NDArray[np.int64],
+    idx_j_array: npt.NDArray[np.int64],
+    target_lengths: npt.NDArray[np.float64],
+    k_values: npt.NDArray[np.float64],
+    box_size: Tuple[float, float],
+    gradient: npt.NDArray[np.float64],
+) -> float:
+    """
+    Calculate the bond strain from contiguous per-bond arrays and add its gradient to the given gradient array.
+
+    The kernel is compiled with numba and evaluates the strain and the gradient in a single loop over all bonds, without
+    allocating intermediate arrays.
+
+    Parameters
+    ----------
+    positions : ndarray
+        Positions of all atoms (N x 2).
+    idx_i_array : ndarray
+        Indices of the first atom of each bond.
+    idx_j_array : ndarray
+        Indices of the second atom of each bond.
+    target_lengths : ndarray
+        Target length of each bond.
+    k_values : ndarray
+        Force constant of each bond.
+    box_size : Tuple[float, float]
+        Dimensions of the periodic box.
+    gradient : ndarray
+        Gradient array (N x 2) the gradient of the bond strain with respect to the positions is added to.
+
+    Returns
+    -------
+    total_strain : float
+        The total bond strain in the structure.
+    """
+    box_width = box_size[0]
+    box_height = box_size[1]
+
+    total_bond_strain = 0.0
+
+    for bond in range(idx_i_array.shape[0]):
+        idx_i = idx_i_array[bond]
+        idx_j = idx_j_array[bond]
+
+        # Displacement vector pointing from atom i to atom j, wrapped according to the minimum image convention
+        dx = positions[idx_j, 0] - positions[idx_i, 0]
+        dy = positions[idx_j, 1] - positions[idx_i, 1]
+        dx -= np.round(dx / box_width) * box_width
+        dy -= np.round(dy / box_height) * box_height
+
+        # Calculate bond length and bond strain
+        current_length = np.sqrt(dx * dx + dy * dy)
+        deviation = current_length - target_lengths[bond]
+        total_bond_strain += 0.5 * k_values[bond] * deviation * deviation
+
+        # dE/dr_j = k * (L - L0) * (r_j - r_i) / L and dE/dr_i = -dE/dr_j
+        if current_length == 0.0:
+            current_length = 1e-8
+        factor = k_values[bond] * deviation / current_length
+        gradient[idx_j, 0] += factor * dx
+        gradient[idx_j, 1] += factor * dy
+        gradient[idx_i, 0] -= factor * dx
+        gradient[idx_i, 1] -= factor * dy
+
+    return total_bond_strain
+
+
+@jit(nopython=True, cache=True)
+def _angle_strain_and_gradient_kernel(
+    positions: npt.NDArray[np.float64],
+    idx_i_array: npt.NDArray[np.int64],
+    idx_j_array: npt.NDArray[np.int64],
+    idx_k_array: npt.NDArray[np.int64],
+    target_angles: npt.NDArray[np.float64],
+    k_values: npt.NDArray[np.float64],
+    box_size: Tuple[float, float],
+    gradient: npt.NDArray[np.float64],
+) -> float:
+    """
+    Calculate the angle strain from contiguous per-angle arrays and add its gradient to the given gradient array.
+
+    The kernel is compiled with numba and evaluates the strain and the gradient in a single loop over all angles,
+    without allocating intermediate arrays.
+
+    Parameters
+    ----------
+    positions : ndarray
+        Positions of all atoms (N x 2).
+    idx_i_array : ndarray
+        Indices of the first outer atom of each angle.
+    idx_j_array : ndarray
+        Indices of the central atom of each angle.
+    idx_k_array : ndarray
+        Indices of the second outer atom of each angle.
+    target_angles : ndarray
+        Target angle of each angle in radians.
+    k_values : ndarray
+        Force constant of each angle.
+    box_size : Tuple[float, float]
+        Dimensions of the periodic box.
+    gradient : ndarray
+        Gradient array (N x 2) the gradient of the angle strain with respect to the positions is added to.
+
+    Returns
+    -------
+    total_strain : float
+        The total angular strain in the structure.
+    """
+    box_width = box_size[0]
+    box_height = box_size[1]
+
+    total_angle_strain = 0.0
+
+    for angle in range(idx_i_array.shape[0]):
+        idx_i = idx_i_array[angle]
+        idx_j = idx_j_array[angle]
+        idx_k = idx_k_array[angle]
+
+        # Vectors v1 = r_j - r_i and v2 = r_j - r_k, wrapped according to the minimum image convention
+        v1x = positions[idx_j, 0] - positions[idx_i, 0]
+        v1y = positions[idx_j, 1] - positions[idx_i, 1]
+        v1x -= np.round(v1x / box_width) * box_width
+        v1y -= np.round(v1y / box_height) * box_height
+        v2x = positions[idx_j, 0] - positions[idx_k, 0]
+        v2y = positions[idx_j, 1] - positions[idx_k, 1]
+        v2x -= np.round(v2x / box_width) * box_width
+        v2y -= np.round(v2y / box_height) * box_height
+
+        # Calculate norms and prevent division by zero
+        norm_v1 = np.sqrt(v1x * v1x + v1y * v1y)
+        norm_v2 = np.sqrt(v2x * v2x + v2y * v2y)
+        if norm_v1 == 0.0:
+            norm_v1 = 1e-8
+        if norm_v2 == 0.0:
+            norm_v2 = 1e-8
+
+        # Calculate cos_theta safely and the angle strain
+        norm_product = norm_v1 * norm_v2
+        cos_theta = min(max((v1x * v2x + v1y * v2y) / norm_product, -1.0), 1.0)
+        delta_theta = np.arccos(cos_theta) - target_angles[angle]
+        total_angle_strain += 0.5 * k_values[angle] * delta_theta * delta_theta
+
+        # dE/dcos(theta) = k * (theta - theta0) * dtheta/dcos(theta) = -k * (theta - theta0) / sin(theta)
+        sin_theta = max(np.sqrt(1.0 - cos_theta * cos_theta), 1e-8)
+        d_strain_d_cos = -k_values[angle] * delta_theta / sin_theta
+
+        # dcos(theta)/dv1 = v2 / (|v1| |v2|) - cos(theta) * v1 / |v1|^2 (and analogously for v2)
+        grad_v1x = d_strain_d_cos * (v2x / norm_product - cos_theta * v1x / (norm_v1 * norm_v1))
+        grad_v1y = d_strain_d_cos * (v2y / norm_product - cos_theta * v1y / (norm_v1 * norm_v1))
+        grad_v2x = d_strain_d_cos * (v1x / norm_product - cos_theta * v2x / (norm_v2 * norm_v2))
+        grad_v2y = d_strain_d_cos * (v1y / norm_product - cos_theta * v2y / (norm_v2 * norm_v2))
+
+        # The central atom j receives the sum of both contributions
+        gradient[idx_i, 0] -= grad_v1x
+        gradient[idx_i, 1] -= grad_v1y
+        gradient[idx_k, 0] -= grad_v2x
+        gradient[idx_k, 1] -= grad_v2y
+        gradient[idx_j, 0] += grad_v1x + grad_v2x
+        gradient[idx_j, 1] += grad_v1y + grad_v2y
+
+    return total_angle_strain
+
+
+@jit(nopython=True, cache=True)
+def _total_strain_and_gradient_kernel(
+    positions: npt.NDArray[np.float64],
+    bond_idx_i_array: npt.NDArray[np.int64],
+    bond_idx_j_array: npt.NDArray[np.int64],
+    target_lengths: npt.NDArray[np.float64],
+    bond_k_values: npt.NDArray[np.float64],
+    angle_idx_i_array: npt.NDArray[np.int64],
+    angle_idx_j_array: npt.NDArray[np.int64],
+    angle_idx_k_array: npt.NDArray[np.int64],
+    target_angles: npt.NDArray[np.float64],
+    angle_k_values: npt.NDArray[np.float64],
+    box_size: Tuple[float, float],
+) -> Tuple[float, npt.NDArray[np.float64]]:
+    """
+    Calculate the total structural strain (bond + angular) and its gradient in a single compiled call.
+
+    Both the bond and the angle kernel accumulate into the same gradient array, so only one gradient array is allocated
+    per evaluation.
+
+    Parameters
+    ----------
+    positions : ndarray
+        Positions of all atoms (N x 2).
+    bond_idx_i_array, bond_idx_j_array : ndarray
+        Indices of the two atoms of each bond.
+    target_lengths : ndarray
+        Target length of each bond.
+    bond_k_values : ndarray
+        Force constant of each bond.
+    angle_idx_i_array, angle_idx_j_array, angle_idx_k_array : ndarray
+        Indices of the first outer, the central and the second outer atom of each angle.
+    target_angles : ndarray
+        Target angle of each angle in radians.
+    angle_k_values : ndarray
+        Force constant of each angle.
+    box_size : Tuple[float, float]
+        Dimensions of the periodic box.
+
+    Returns
+    -------
+    total_strain : float
+        The total structural strain in the system.
+    gradient : ndarray
+        Gradient of the total strain with respect to the positions (N x 2).
+    """
+    gradient = np.zeros_like(positions)
+    bond_strain = _bond_strain_and_gradient_kernel(
+        positions, bond_idx_i_array, bond_idx_j_array, target_lengths, bond_k_values, box_size, gradient
+    )
+    angle_strain = _angle_strain_and_gradient_kernel(
+        positions,
+        angle_idx_i_array,
+        angle_idx_j_array,
+        angle_idx_k_array,
+        target_angles,
+        angle_k_values,
+        box_size,
+        gradient,
+    )
+    return bond_strain + angle_strain, gradient
+
+
 class StructureOptimizer:
     def __init__(self, structure: "MaterialStructure", config: OptimizationConfig):
         """
@@ -85,6 +314,13 @@ class StructureOptimizer:
         """The networkx graph representing the material structure."""
         self.doping_handler = structure.doping_handler
         """The doping handler for the material structure."""
+        self.minimization_method: str = "L-BFGS-B"
+        """The scipy.optimize.minimize method used for the optimization. Use "Newton-CG" for truncated Newton steps
+        based on Hessian-vector products approximated by finite differences of the analytic strain gradient."""
+        self.minimization_options: Dict[str, Any] = {}
+        """Additional solver options passed to scipy.optimize.minimize (e.g. "maxiter", "ftol", "gtol" or "maxcor" for
+        L-BFGS-B). Loosening the tolerances speeds up coarse pre-optimizations of large sheets, but shifts the final
+        atom positions by a few hundredths of an angstrom, so the scipy defaults are kept unless overridden."""
 
         # Assign constants from config
         self.k_inner_bond = config.k_inner_bond
@@ -160,8 +396,11 @@ class StructureOptimizer:
         # Get the initial positions of atoms, ordered consistently
         positions = {node: self.graph.nodes[node]["position"] for node in all_nodes}
 
-        # Flatten the positions into a 1D array for optimization (alternating x and y)
-        x0 = np.array([coord for node in all_nodes for coord in (positions[node][0], positions[node][1])])
+        # Flatten the positions into a 1D array for optimization (alternating x and y); the array is filled directly
+        # from the positions without building an intermediate Python list
+        x0 = np.fromiter(
+            (coord for node in all_nodes for coord in positions[node][:2]), dtype=np.float64, count=2 * len(all_nodes)
+        )
 
         # Define the box size for minimum image distance calculation
         box_size = (
@@ -205,17 +444,34 @@ class StructureOptimizer:
             # Update the progress bar by one step
             progress_bar.update(1)
 
-        # Objective function for optimization
-        def total_strain(x):
-            return self._total_strain(x, bond_array, angle_array, box_size)
+        # Unpack the bond and angle terms once into contiguous arrays, as they do not change during the optimization
+        bond_terms = self._bond_terms(bond_array)
+        angle_terms = self._angle_terms(angle_array)
+
+        # Objective function for optimization returning the strain together with its analytic gradient, so that
+        # L-BFGS-B does not have to estimate the gradient by finite differences
+        def total_strain_and_gradient(x):
+            strain, gradient = _total_strain_and_gradient_kernel(x.reshape(-1, 2), *bond_terms, *angle_terms, box_size)
+            return strain, gradient.ravel()
+
+        # Newton-type methods additionally need the curvature of the strain along the search directions
+        minimize_kwargs = {}
+        if self.minimization_method == "Newton-CG":
+
+            def total_strain_hessp(x, p):
+                return self._total_strain_hessp(x, p, bond_terms, angle_terms, box_size)
+
+            minimize_kwargs["hessp"] = total_strain_hessp
 
         # Start the optimization process with the callback to update progress
         result = minimize(
-            total_strain,
+            total_strain_and_gradient,
             x0,
-            method="L-BFGS-B",
+            method=self.minimization_method,
+            jac=True,
             callback=optimization_callback,
-            options={"disp": True},
+            options={"disp": True, **self.minimization_options},
+            **minimize_kwargs,
         )
 
         # Close the progress bar
@@ -253,12 +509,11 @@ class StructureOptimizer:
         box_size : Tuple[float, float]
             Dimensions of the periodic box.
         """
-        # Update the positions of atoms in the graph
-        position_dict = {
-            node: Position(optimized_positions[idx][0], optimized_positions[idx][1], positions[node][2])
-            for idx, node in enumerate(all_nodes)
-        }
-        nx.set_node_attributes(self.graph, position_dict, "position")
+        # Update the positions of atoms in the graph; the optimized positions are converted to Python floats in one go
+        # instead of indexing the array twice per node, and written directly into the node attribute dictionaries
+        node_data = self.graph.nodes
+        for node, (x, y) in zip(all_nodes, optimized_positions.tolist()):
+            node_data[node]["position"] = Position(x, y, positions[node][2])
 
         # Extract positions for bond length calculation
         positions_array = optimized_positions  # Shape: (num_nodes, 2)
@@ -271,14 +526,12 @@ class StructureOptimizer:
         # Calculate bond lengths
         current_lengths, _ = minimum_image_distance_vectorized(positions_i, positions_j, box_size)
 
-        # Prepare bond length updates for all bonds
-        edge_updates = {
-            (all_nodes[idx_i_array[idx]], all_nodes[idx_j_array[idx]]): {"bond_length": current_lengths[idx]}
-            for idx in range(len(idx_i_array))
-        }
-
-        # Update the bond lengths in the graph
-        nx.set_edge_attributes(self.graph, edge_updates)
+        # Update the bond lengths in the graph; the index and length arrays are converted to Python lists once, so that
+        # the node lookups in all_nodes do not index into numpy arrays element by element. The edge attribute dictionary
+        # is shared by both directions of an undirected edge, so a single write per bond suffices
+        adjacency = self.graph.adj
+        for idx_i, idx_j, length in zip(idx_i_array.tolist(), idx_j_array.tolist(), current_lengths.tolist()):
+            adjacency[all_nodes[idx_i]][all_nodes[idx_j]]["bond_length"] = length
 
     def _assign_target_bond_lengths(
         self, node_index_map: Dict[int, int], all_structures: List["DopingStructure"]
@@ -313,6 +566,7 @@ class StructureOptimizer:
             properties = self.doping_handler.species_properties[structure.species]
 
             cycle_atoms = structure.cycle
+            cycle_atom_set = set(cycle_atoms)
             neighbor_atoms = structure.neighboring_atoms
 
             # Map node IDs to indices in the neighbors list
@@ -334,7 +588,7 @@ class StructureOptimizer:
 
             # Bonds between cycle atoms and their neighbors
             for idx, node_i in enumerate(cycle_atoms):
-                neighbors = [n for n in self.graph.neighbors(node_i) if n not in cycle_atoms]
+                neighbors = [n for n in self.graph.neighbors(node_i) if n not in cycle_atom_set]
                 for neighbor in neighbors:
                     bond = (min(node_i, neighbor), max(node_i, neighbor))
                     middle_bond_set.add(bond)
@@ -414,10 +668,12 @@ class StructureOptimizer:
             properties = self.doping_handler.species_properties[structure.species]
 
             cycle_atoms = structure.cycle
+            cycle_atom_set = set(cycle_atoms)
             neighbor_atoms = structure.neighboring_atoms
 
-            # Map node IDs to indices in the neighbors list
+            # Map node IDs to indices in the neighbors list (and in the cycle)
             neighbor_atom_indices = {node: idx for idx, node in enumerate(neighbor_atoms)}
+            cycle_atom_indices = {node: idx for idx, node in enumerate(cycle_atoms)}
 
             # Angles within the cycle
             # Extend the cycle to account for the closed loop by adding the first two nodes at the end
@@ -435,8 +691,8 @@ class StructureOptimizer:
             # Handle additional angles for PYRIDINIC_1
             if structure.species == NitrogenSpecies.PYRIDINIC_1 and structure.additional_edge:
                 node_a, node_b = structure.additional_edge
-                idx_a = cycle_atoms.index(node_a)
-                idx_b = cycle_atoms.index(node_b)
+                idx_a = cycle_atom_indices[node_a]
+                idx_b = cycle_atom_indices[node_b]
 
                 # Ensure node_a is before node_b in the cycle
                 if idx_a > idx_b:
@@ -468,7 +724,7 @@ class StructureOptimizer:
 
             # Angles involving neighboring atoms
             for idx_j, node_j in enumerate(cycle_atoms):
-                neighbors = [n for n in self.graph.neighbors(node_j) if n not in cycle_atoms]
+                neighbors = [n for n in self.graph.neighbors(node_j) if n not in cycle_atom_set]
                 node_i_prev = cycle_atoms[idx_j - 1]  # Wrap-around to get the previous node
                 node_k_next = cycle_atoms[(idx_j + 1) % len(cycle_atoms)]  # Wrap-around for the next node
 
@@ -543,6 +799,49 @@ class StructureOptimizer:
 
         return angle_array
 
+    @staticmethod
+    def _bond_terms(bond_array: npt.NDArray) -> Tuple[npt.NDArray, ...]:
+        """
+        Unpack the structured bond array into contiguous per-field arrays (structure of arrays).
+
+        Parameters
+        ----------
+        bond_array : ndarray
+            Array of bonds with target lengths and force constants.
+
+        Returns
+        -------
+        Tuple[ndarray, ...]
+            The atom indices, target lengths and force constants of all bonds.
+        """
+        return tuple(np.ascontiguousarray(bond_array[name]) for name in ("idx_i", "idx_j", "target_length", "k"))
+
+    @staticmethod
+    def _angle_terms(angle_array: npt.NDArray) -> Tuple[npt.NDArray, ...]:
+        """
+        Unpack the structured angle array into contiguous per-field arrays (structure of arrays).
+
+        The target angles are converted from degrees to radians here, so that the conversion is not repeated in every
+        strain evaluation.
+
+        Parameters
+        ----------
+        angle_array : ndarray
+            Array of angles with target angles and force constants.
+
+        Returns
+        -------
+        Tuple[ndarray, ...]
+            The atom indices, target angles (in radians) and force constants of all angles.
+        """
+        return (
+            np.ascontiguousarray(angle_array["idx_i"]),
+            np.ascontiguousarray(angle_array["idx_j"]),
+            np.ascontiguousarray(angle_array["idx_k"]),
+            np.radians(angle_array["target_angle"]),
+            np.ascontiguousarray(angle_array["k"]),
+        )
+
     @staticmethod
     def _bond_strain(x: npt.NDArray[np.float64], bond_array: npt.NDArray, box_size: Tuple[float, float]) -> float:
         """
@@ -562,23 +861,38 @@ class StructureOptimizer:
         total_strain : float
             The total bond strain in the structure.
         """
-        # Extract positions
-        idx_i_array = bond_array["idx_i"]
-        idx_j_array = bond_array["idx_j"]
-        positions_i = x[np.ravel(np.column_stack((idx_i_array * 2, idx_i_array * 2 + 1)))]
-        positions_j = x[np.ravel(np.column_stack((idx_j_array * 2, idx_j_array * 2 + 1)))]
-        positions_i = positions_i.reshape(-1, 2)
-        positions_j = positions_j.reshape(-1, 2)
+        total_bond_strain, _ = StructureOptimizer._bond_strain_and_gradient(x, bond_array, box_size)
+        return total_bond_strain
 
-        # Calculate bond lengths
-        current_lengths, _ = minimum_image_distance_vectorized(positions_i, positions_j, box_size)
+    @staticmethod
+    def _bond_strain_and_gradient(
+        x: npt.NDArray[np.float64], bond_array: npt.NDArray, box_size: Tuple[float, float]
+    ) -> Tuple[float, npt.NDArray[np.float64]]:
+        """
+        Calculate the bond strain and its analytic gradient with respect to the atom positions.
 
-        # Calculate bond strain
-        target_lengths = bond_array["target_length"]
-        k_values = bond_array["k"]
-        total_bond_strain = 0.5 * np.sum(k_values * (current_lengths - target_lengths) ** 2)
+        Parameters
+        ----------
+        x : ndarray
+            Flattened array of positions of all atoms.
+        bond_array : ndarray
+            Array of bonds with target lengths and force constants.
+        box_size : Tuple[float, float]
+            Dimensions of the periodic box.
 
-        return total_bond_strain
+        Returns
+        -------
+        total_strain : float
+            The total bond strain in the structure.
+        gradient : ndarray
+            Flattened gradient of the bond strain with respect to `x`.
+        """
+        positions = x.reshape(-1, 2)
+        gradient = np.zeros_like(positions)
+        total_bond_strain = _bond_strain_and_gradient_kernel(
+            positions, *StructureOptimizer._bond_terms(bond_array), box_size, gradient
+        )
+        return total_bond_strain, gradient.ravel()
 
     @staticmethod
     def _angle_strain(x: npt.NDArray[np.float64], angle_array: npt.NDArray, box_size: Tuple[float, float]) -> float:
@@ -599,44 +913,39 @@ class StructureOptimizer:
         total_strain : float
             The total angular strain in the structure.
         """
-        # Extract positions
-        idx_i_array = angle_array["idx_i"]
-        idx_j_array = angle_array["idx_j"]
-        idx_k_array = angle_array["idx_k"]
-        positions_i = x[np.ravel(np.column_stack((idx_i_array * 2, idx_i_array * 2 + 1)))]
-        positions_j = x[np.ravel(np.column_stack((idx_j_array * 2, idx_j_array * 2 + 1)))]
-        positions_k = x[np.ravel(np.column_stack((idx_k_array * 2, idx_k_array * 2 + 1)))]
-        positions_i = positions_i.reshape(-1, 2)
-        positions_j = positions_j.reshape(-1, 2)
-        positions_k = positions_k.reshape(-1, 2)
-
-        # Calculate vectors
-        _, v1 = minimum_image_distance_vectorized(positions_i, positions_j, box_size)
-        _, v2 = minimum_image_distance_vectorized(positions_k, positions_j, box_size)
-
-        # Calculate norms
-        norm_v1 = np.linalg.norm(v1, axis=1)
-        norm_v2 = np.linalg.norm(v2, axis=1)
-
-        # Prevent division by zero
-        norm_v1 = np.where(norm_v1 == 0, 1e-8, norm_v1)
-        norm_v2 = np.where(norm_v2 == 0, 1e-8, norm_v2)
-
-        # Calculate cos_theta safely
-        cos_theta = np.einsum("ij,ij->i", v1, v2) / (norm_v1 * norm_v2)
-        cos_theta = np.clip(cos_theta, -1.0, 1.0)
-
-        # Calculate angles
-        theta = np.arccos(cos_theta)
-
-        # Calculate angle strain
-        target_angles = np.radians(angle_array["target_angle"])
-        delta_theta = theta - target_angles
-        k_values = angle_array["k"]
-        total_angle_strain = 0.5 * np.sum(k_values * delta_theta**2)
-
+        total_angle_strain, _ = StructureOptimizer._angle_strain_and_gradient(x, angle_array, box_size)
         return total_angle_strain
 
+    @staticmethod
+    def _angle_strain_and_gradient(
+        x: npt.NDArray[np.float64], angle_array: npt.NDArray, box_size: Tuple[float, float]
+    ) -> Tuple[float, npt.NDArray[np.float64]]:
+        """
+        Calculate the angle strain and its analytic gradient with respect to the atom positions.
+
+        Parameters
+        ----------
+        x : ndarray
+            Flattened array of positions of all atoms.
+        angle_array : ndarray
+            Array of angles with target angles and force constants.
+        box_size : Tuple[float, float]
+            Dimensions of the periodic box.
+
+        Returns
+        -------
+        total_strain : float
+            The total angular strain in the structure.
+        gradient : ndarray
+            Flattened gradient of the angle strain with respect to `x`.
+        """
+        positions = x.reshape(-1, 2)
+        gradient = np.zeros_like(positions)
+        total_angle_strain = _angle_strain_and_gradient_kernel(
+            positions, *StructureOptimizer._angle_terms(angle_array), box_size, gradient
+        )
+        return total_angle_strain, gradient.ravel()
+
     def _total_strain(
         self,
         x: npt.NDArray[np.float64],
@@ -666,3 +975,50 @@ class StructureOptimizer:
         bond_strain = self._bond_strain(x, bond_array, box_size)
         angle_strain = self._angle_strain(x, angle_array, box_size)
         return bond_strain + angle_strain
+
+    @staticmethod
+    def _total_strain_hessp(
+        x: npt.NDArray[np.float64],
+        p: npt.NDArray[np.float64],
+        bond_terms: Tuple[npt.NDArray, ...],
+        angle_terms: Tuple[npt.NDArray, ...],
+        box_size: Tuple[float, float],
+    ) -> npt.NDArray[np.float64]:
+        """
+        Calculate the product of the Hessian of the total structural strain with an arbitrary vector.
+
+        Parameters
+        ----------
+        x : ndarray
+            Flattened array of positions of all atoms.
+        p : ndarray
+            Flattened direction vector to multiply the Hessian with.
+        bond_terms : Tuple[ndarray, ...]
+            The unpacked bond terms as returned by `_bond_terms`.
+        angle_terms : Tuple[ndarray, ...]
+            The unpacked angle terms as returned by `_angle_terms`.
+        box_size : Tuple[float, float]
+            Dimensions of the periodic box.
+
+        Returns
+        -------
+        hessp : ndarray
+            The Hessian-vector product.
+
+        Notes
+        -----
+        No Hessian matrix is built. The product with `p` is approximated by a central finite difference of the
+        analytic gradient along `p`, which costs two gradient evaluations.
+        """
+        norm_p = np.linalg.norm(p)
+        if norm_p == 0:
+            return np.zeros_like(x)
+
+        eps = np.sqrt(np.finfo(np.float64).eps) * max(1.0, np.linalg.norm(x)) / norm_p
+        _, gradient_plus = _total_strain_and_gradient_kernel(
+            (x + eps * p).reshape(-1, 2), *bond_terms, *angle_terms, box_size
+        )
+        _, gradient_minus = _total_strain_and_gradient_kernel(
+            (x - eps * p).reshape(-1, 2), *bond_terms, *angle_terms, box_size
+        )
+        return ((gradient_plus - gradient_minus) / (2 * eps)).ravel()
@@ -26,7 +26,7 @@ from conan.playground.doping import (
     StructuralComponents,
 )
 from conan.playground.structure_optimizer import OptimizationConfig, StructureOptimizer
-from conan.playground.utils import Position, create_position
+from conan.playground.utils import Position
 
 
 # Abstract base class for material structures
@@ -570,32 +570,32 @@ class GrapheneSheet(Structure2D):
         # Build the initial graphene sheet structure
         self.build_structure()
 
-    @property
+    @cached_property
     def cc_x_distance(self):
         """Calculate the distance between atoms in the x direction."""
         return self.c_c_bond_length * sin(pi / 6)
 
-    @property
+    @cached_property
     def cc_y_distance(self):
         """Calculate the distance between atoms in the y direction."""
         return self.c_c_bond_length * cos(pi / 6)
 
-    @property
+    @cached_property
     def num_cells_x(self):
         """Calculate the number of unit cells in the x direction based on sheet size and bond distance."""
         return int(self.sheet_size[0] // (2 * self.c_c_bond_length + 2 * self.cc_x_distance))
 
-    @property
+    @cached_property
     def num_cells_y(self):
         """Calculate the number of unit cells in the y direction based on sheet size and bond distance."""
         return int(self.sheet_size[1] // (2 * self.cc_y_distance))
 
-    @property
+    @cached_property
     def actual_sheet_width(self):
         """Calculate the actual width of the graphene sheet based on the number of unit cells and bond distance."""
         return self.num_cells_x * (2 * self.c_c_bond_length + 2 * self.cc_x_distance) - self.c_c_bond_length
 
-    @property
+    @cached_property
     def actual_sheet_height(self):
         """Calculate the actual height of the graphene sheet based on the number of unit cells and bond distance."""
         return self.num_cells_y * (2 * self.cc_y_distance) - self.cc_y_distance
@@ -652,69 +652,64 @@ class GrapheneSheet(Structure2D):
         """
         Build the graphene sheet structure by creating nodes and edges (using graph theory via networkx).
 
-        This method iterates over the entire sheet, adding nodes and edges for each unit cell.
-        It also connects adjacent unit cells and adds periodic boundary conditions.
+        The atom positions and the bonds within and between all unit cells are computed with numpy for the entire sheet
+        at once and added to the graph in a single batch each. Afterward, periodic boundary conditions are added.
         """
 
-        index = 0
-        for y in range(self.num_cells_y):
-            for x in range(self.num_cells_x):
-                x_offset = x * (2 * self.c_c_bond_length + 2 * self.cc_x_distance)
-                y_offset = y * (2 * self.cc_y_distance)
+        num_cells = self.num_cells_x * self.num_cells_y
+        num_nodes_x = 4 * self.num_cells_x
+
+        # Offsets of all unit cells, ordered row by row (the nodes of cell y * num_cells_x + x start at 4 times that)
+        cell_y, cell_x = np.divmod(np.arange(num_cells), self.num_cells_x)
+        x_offsets = cell_x * (2 * self.c_c_bond_length + 2 * self.cc_x_distance)
+        y_offsets = cell_y * (2 * self.cc_y_distance)
 
-                # Add nodes and edges for the unit cell
-                self._add_unit_cell(index, x_offset, y_offset)
+        # Define the positions of the four atoms within each unit cell (one row per cell)
+        x_positions = np.column_stack(
+            (
+                x_offsets,
+                x_offsets + self.cc_x_distance,
+                x_offsets + self.cc_x_distance + self.c_c_bond_length,
+                x_offsets + 2 * self.cc_x_distance + self.c_c_bond_length,
+            )
+        )
+        y_positions = np.column_stack(
+            (y_offsets, y_offsets + self.cc_y_distance, y_offsets + self.cc_y_distance, y_offsets)
+        )
 
-                # Add horizontal bonds between adjacent unit cells
-                if x > 0:
-                    self.graph.add_edge(index - 1, index, bond_length=self.c_c_bond_length)
+        # Add nodes with positions, element type (carbon) and possible doping site flag
+        self.graph.add_nodes_from(
+            (index, {"element": "C", "position": Position(x, y, 0.0), "possible_doping_site": True})
+            for index, (x, y) in enumerate(zip(x_positions.ravel().tolist(), y_positions.ravel().tolist()))
+        )
 
-                # Add vertical bonds between unit cells in adjacent rows
-                if y > 0:
-                    self.graph.add_edge(index - 4 * self.num_cells_x + 1, index, bond_length=self.c_c_bond_length)
-                    self.graph.add_edge(index - 4 * self.num_cells_x + 2, index + 3, bond_length=self.c_c_bond_length)
+        # Collect the bonds of each unit cell in the order they connect the cell to the sheet: the internal bonds, the
+        # horizontal bond to the previous cell in the row and the vertical bonds to the previous row. Bonds that do not
+        # exist at the lower sheet boundaries are masked out, keeping the order of all remaining bonds
+        first_indices = 4 * np.arange(num_cells)
+        cell_edges = np.stack(
+            [
+                np.column_stack((first_indices, first_indices + 1)),
+                np.column_stack((first_indices + 1, first_indices + 2)),
+                np.column_stack((first_indices + 2, first_indices + 3)),
+                np.column_stack((first_indices - 1, first_indices)),
+                np.column_stack((first_indices - num_nodes_x + 1, first_indices)),
+                np.column_stack((first_indices - num_nodes_x + 2, first_indices + 3)),
+            ],
+            axis=1,
+        )
+        edge_mask = np.ones((num_cells, 6), dtype=bool)
+        edge_mask[:, 3] = cell_x > 0
+        edge_mask[:, 4:] = (cell_y > 0)[:, np.newaxis]
 
-                index += 4
+        # Add all bonds within and between the unit cells at once (the node pairs are zipped lazily from two flat index
+        # lists, which avoids materializing one small list object per bond)
+        edges = cell_edges[edge_mask]
+        self.graph.add_edges_from(zip(edges[:, 0].tolist(), edges[:, 1].tolist()), bond_length=self.c_c_bond_length)
 
         # Add periodic boundary conditions
         self._add_periodic_boundaries()
 
-    def _add_unit_cell(self, index: int, x_offset: float, y_offset: float):
-        """
-        Add nodes and internal bonds within a unit cell.
-
-        Parameters
-        ----------
-        index : int
-            The starting index for the nodes in the unit cell.
-        x_offset : float
-            The x-coordinate offset for the unit cell.
-        y_offset : float
-            The y-coordinate offset for the unit cell.
-        """
-
-        # Define relative positions of atoms within the unit cell
-        unit_cell_positions = [
-            create_position(x_offset, y_offset),
-            create_position(x_offset + self.cc_x_distance, y_offset + self.cc_y_distance),
-            create_position(x_offset + self.cc_x_distance + self.c_c_bond_length, y_offset + self.cc_y_distance),
-            create_position(x_offset + 2 * self.cc_x_distance + self.c_c_bond_length, y_offset),
-        ]
-
-        # Add nodes with positions, element type (carbon) and possible doping site flag
-        nodes = [
-            (index + i, {"element": "C", "position": pos, "possible_doping_site": True})
-            for i, pos in enumerate(unit_cell_positions)
-        ]
-        self.graph.add_nodes_from(nodes)
-
-        # Add internal bonds within the unit cell
-        edges = [
-            (index + i, index + i + 1, {"bond_length": self.c_c_bond_length})
-            for i in range(len(unit_cell_positions) - 1)
-        ]
-        self.graph.add_edges_from(edges)
-
     def _add_periodic_boundaries(self):
         """
         Add periodic boundary conditions to the graphene sheet.
@@ -729,24 +724,23 @@ class GrapheneSheet(Structure2D):
         right_edge_indices = base_indices_y + (self.num_cells_x - 1) * 4 + 3
         left_edge_indices = base_indices_y
 
-        # Add horizontal periodic boundary conditions
-        self.graph.add_edges_from(
-            zip(right_edge_indices, left_edge_indices), bond_length=self.c_c_bond_length, periodic=True
-        )
-
         # Generate base indices for vertical boundaries
         top_left_indices = np.arange(self.num_cells_x) * 4
         bottom_left_indices = top_left_indices + (self.num_cells_y - 1) * num_nodes_x + 1
         bottom_right_indices = top_left_indices + (self.num_cells_y - 1) * num_nodes_x + 2
 
-        # Add vertical periodic boundary conditions
-        self.graph.add_edges_from(
-            zip(bottom_left_indices, top_left_indices), bond_length=self.c_c_bond_length, periodic=True
-        )
-        self.graph.add_edges_from(
-            zip(bottom_right_indices, top_left_indices + 3), bond_length=self.c_c_bond_length, periodic=True
+        # Stack the horizontal and both vertical periodic boundary conditions into one (n, 2) edge array
+        periodic_edges = np.concatenate(
+            [
+                np.column_stack((right_edge_indices, left_edge_indices)),
+                np.column_stack((bottom_left_indices, top_left_indices)),
+                np.column_stack((bottom_right_indices, top_left_indices + 3)),
+            ]
         )
 
+        # Add all periodic boundary conditions at once
+        self.graph.add_edges_from(periodic_edges.tolist(), bond_length=self.c_c_bond_length, periodic=True)
+
     def add_nitrogen_doping(
         self,
         total_percentage: float = None,
@@ -164,7 +164,7 @@ def minimum_image_distance(
     return distance, displacement
 
 
-@jit(nopython=True)
+@jit(nopython=True, cache=True)
 def minimum_image_distance_vectorized(
     pos1: npt.NDArray, pos2: npt.NDArray, box_size: Union[Tuple[float, float], Tuple[float, float, float]]
 ) -> (npt.NDArray, npt.NDArray):
@@ -194,20 +194,27 @@ def minimum_image_distance_vectorized(
     if pos_dim != box_dim:
         raise ValueError(f"Dimension mismatch: positions are {pos_dim}D, but box_size is {box_dim}D.")
 
-    # Calculate the vector difference between the two positions
-    delta = pos2 - pos1
-
-    # Convert the tuple to a numpy array for broadcasting
+    # Convert the tuple to a numpy array for indexing
     box_size_arr = np.array(box_size)
 
-    # Adjust the difference vector for periodic boundary conditions
-    # This ensures that the atoms are considered within the bounds of the box
-    delta -= np.round(delta / box_size_arr) * box_size_arr
-
-    # Calculate the Euclidean distance using the adjusted difference vector
-    # np.sum(delta**2, axis=1) computes the squared distances for each pair of points
-    # np.sqrt(...) computes the Euclidean distance
-    dist = np.sqrt(np.sum(delta**2, axis=1))
+    num_pairs = pos1.shape[0]
+    delta = np.empty((num_pairs, pos_dim))
+    dist = np.empty(num_pairs)
+
+    # Compute the wrapped difference vectors and their lengths in a single pass over all pairs, without creating
+    # temporary arrays for the intermediate steps
+    for idx in range(num_pairs):
+        squared_distance = 0.0
+        for dim in range(pos_dim):
+            # Calculate the vector difference between the two positions
+            d = pos2[idx, dim] - pos1[idx, dim]
+            # Adjust the difference vector for periodic boundary conditions (branchless wrap via rounding)
+            # This ensures that the atoms are considered within the bounds of the box
+            d -= np.round(d / box_size_arr[dim]) * box_size_arr[dim]
+            delta[idx, dim] = d
+            squared_distance += d * d
+        # Calculate the Euclidean distance using the adjusted difference vector
+        dist[idx] = np.sqrt(squared_distance)
 
     return dist, delta
 
@@ -286,7 +293,9 @@ def get_neighbors_within_distance(graph: nx.Graph, kdtree: KDTree, atom_id: int,
     """
     atom_position = graph.nodes[atom_id]["position"]
     indices = kdtree.query_ball_point(atom_position, distance)
-    return [list(graph.nodes)[index] for index in indices]
+    # Materialize the node list only once instead of once per found index
+    nodes = list(graph.nodes)
+    return [nodes[index] for index in indices]
 
 
 def get_neighbors_via_edges(graph: nx.Graph, atom_id: int, depth: int = 1, inclusive: bool = False) -> List[int]:
@@ -1,9 +1,10 @@
+import random
 import warnings
 
 import pytest
 from ase.io import read
 
-from conan.playground.doping import NitrogenSpecies
+from conan.playground.doping import DopingStructure, DopingStructureCollection, NitrogenSpecies, StructuralComponents
 from conan.playground.structures import GrapheneSheet
 
 
@@ -202,3 +203,73 @@ class TestDopingValidations:
     #         assert actual_distribution[species] == pytest.approx(expected_remaining_percentage_per_species, 0.01), \
     #             f"Expected {expected_remaining_percentage_per_species}% for {species}, but got
     #             {actual_distribution[species]}."
+
+
+class TestDopingStructures:
+
+    def test_pyridinic_cycles_have_expected_length(self):
+        """
+        Test that the cycles found for the pyridinic doping structures have the expected number of atoms.
+        """
+        random.seed(0)
+        graphene = GrapheneSheet(bond_length=1.42, sheet_size=(20, 20))
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", UserWarning)
+            graphene.add_nitrogen_doping(total_percentage=10)
+
+        for structure in graphene.doping_handler.doping_structures:
+            if structure.species == NitrogenSpecies.GRAPHITIC:
+                continue
+            assert len(structure.cycle) == NitrogenSpecies.get_cycle_length(structure.species)
+
+    def test_cycle_longer_than_expected_raises_error(self):
+        """
+        Test that a ValueError is raised if the neighbors only lie on cycles longer than expected for the species.
+        """
+        graphene = GrapheneSheet(bond_length=1.42, sheet_size=(20, 20))
+
+        # Atom 60 is at least seven bonds away from the neighboring atoms 0 and 1, so they do not share a 12-atom cycle
+        structural_components = StructuralComponents([], [0, 1, 60])
+
+        with pytest.raises(ValueError, match="No cycle of at most 12 atoms .* for species Pyridinic-N1"):
+            DopingStructure.create_structure(graphene, NitrogenSpecies.PYRIDINIC_1, structural_components)
+
+
+class TestDopingStructureCollection:
+
+    @pytest.fixture
+    def doping_structures(self):
+        """
+        Fixture for creating one graphitic and two Pyridinic-N 1 doping structures.
+        """
+        return [
+            DopingStructure(NitrogenSpecies.GRAPHITIC, StructuralComponents([5], [4, 6, 21]), [5]),
+            DopingStructure(NitrogenSpecies.PYRIDINIC_1, StructuralComponents([40], [39, 41, 56]), [39]),
+            DopingStructure(NitrogenSpecies.PYRIDINIC_1, StructuralComponents([80], [79, 81, 96]), [79]),
+        ]
+
+    def test_structures_passed_to_constructor_are_indexed(self, doping_structures):
+        """
+        Test that the structures passed to the constructor can be looked up by species.
+        """
+        collection = DopingStructureCollection(structures=doping_structures)
+
+        assert collection.get_structures_for_species(NitrogenSpecies.GRAPHITIC) == doping_structures[:1]
+        assert collection.get_structures_for_species(NitrogenSpecies.PYRIDINIC_1) == doping_structures[1:]
+        assert collection.get_structures_for_species(NitrogenSpecies.PYRIDINIC_4) == []
+
+    def test_reassigning_structures_updates_index(self, doping_structures):
+        """
+        Test that the species lookup follows a reassignment of the structures and later added structures.
+        """
+        collection = DopingStructureCollection()
+        for doping_structure in doping_structures:
+            collection.add_structure(doping_structure)
+
+        collection.structures = [doping_structures[1]]
+        assert collection.get_structures_for_species(NitrogenSpecies.GRAPHITIC) == []
+        assert collection.get_structures_for_species(NitrogenSpecies.PYRIDINIC_1) == [doping_structures[1]]
+
+        collection.add_structure(doping_structures[0])
+        assert collection.get_structures_for_species(NitrogenSpecies.GRAPHITIC) == [doping_structures[0]]
+        assert collection.structures == [doping_structures[1], doping_structures[0]]
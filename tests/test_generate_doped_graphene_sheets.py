@@ -0,0 +1,46 @@
+import random
+
+import pytest
+
+from conan.playground.generate_doped_graphene_sheets import create_graphene_sheets
+
+
+def sheet_summary(graphene):
+    """
+    Summarize a graphene sheet by its atoms (element and position) and bonds, so that sheets can be compared.
+
+    Parameters
+    ----------
+    graphene : GrapheneSheet
+        The graphene sheet to summarize.
+
+    Returns
+    -------
+    tuple
+        The sorted atoms and the sorted bonds of the sheet.
+    """
+    atoms = sorted((node, data["element"], tuple(data["position"])) for node, data in graphene.graph.nodes(data=True))
+    bonds = sorted(tuple(sorted(edge)) for edge in graphene.graph.edges())
+    return atoms, bonds
+
+
+class TestCreateGrapheneSheets:
+
+    @pytest.mark.filterwarnings("ignore::UserWarning")
+    def test_sheets_and_random_state_are_independent_of_n_jobs(self, tmp_path):
+        """
+        Test that sequential and parallel generation create identical sheets for the same seed and that the state of
+        the random module is unchanged by the call.
+        """
+        sheets = {}
+        for n_jobs in [1, 2]:
+            random.seed(42)
+            random_state = random.getstate()
+
+            sheets[n_jobs] = create_graphene_sheets(
+                num_sheets=3, output_folder=str(tmp_path), sheet_sizes=[(15, 15)], write_to_file=False, n_jobs=n_jobs
+            )
+
+            assert random.getstate() == random_state
+
+        assert [sheet_summary(sheet) for sheet in sheets[1]] == [sheet_summary(sheet) for sheet in sheets[2]]
@@ -10,7 +10,11 @@ import pytest
 from ase.io import read
 
 from conan.playground.doping import NitrogenSpecies, OptimizationWeights
-from conan.playground.structure_optimizer import OptimizationConfig, StructureOptimizer
+from conan.playground.structure_optimizer import (
+    OptimizationConfig,
+    StructureOptimizer,
+    _total_strain_and_gradient_kernel,
+)
 from conan.playground.structures import GrapheneSheet
 from conan.playground.utils import write_xyz
 
@@ -657,6 +661,75 @@ class TestStructureOptimizer:
         # Check if the calculated strain matches the expected value
         assert np.isclose(strain, expected_strain), f"Expected strain {expected_strain}, got {strain}."
 
+    def test_total_strain_gradient_matches_finite_differences(self, setup_structure_optimizer_small_system):
+        optimizer = setup_structure_optimizer_small_system
+        x0, bond_array, angle_array, box_size, _, _ = optimizer._prepare_optimization()
+
+        # Displace the atoms slightly so that all bond and angle terms contribute to the gradient
+        rng = np.random.default_rng(0)
+        x = x0 + rng.normal(scale=0.05, size=x0.shape)
+
+        # Evaluate the fused kernel with the same arguments as the objective function in _perform_optimization
+        strain, gradient = _total_strain_and_gradient_kernel(
+            x.reshape(-1, 2), *optimizer._bond_terms(bond_array), *optimizer._angle_terms(angle_array), box_size
+        )
+        gradient = gradient.ravel()
+
+        # The strain returned together with the gradient must match the plain strain calculation
+        assert np.isclose(strain, optimizer._total_strain(x, bond_array, angle_array, box_size))
+
+        # Compare the analytic gradient with a central finite difference approximation
+        eps = 1e-6
+        numerical_gradient = np.empty_like(x)
+        for idx in range(x.shape[0]):
+            x_plus = x.copy()
+            x_minus = x.copy()
+            x_plus[idx] += eps
+            x_minus[idx] -= eps
+            numerical_gradient[idx] = (
+                optimizer._total_strain(x_plus, bond_array, angle_array, box_size)
+                - optimizer._total_strain(x_minus, bond_array, angle_array, box_size)
+            ) / (2 * eps)
+
+        npt.assert_allclose(gradient, numerical_gradient, rtol=1e-4, atol=1e-6)
+
+    def test_newton_cg_reaches_same_strain_as_lbfgsb(self, setup_structure_optimizer_small_system):
+        optimizer = setup_structure_optimizer_small_system
+        x0, bond_array, angle_array, box_size, _, _ = optimizer._prepare_optimization()
+
+        final_strains = {}
+        for method in ["L-BFGS-B", "Newton-CG"]:
+            optimizer.minimization_method = method
+            optimized_positions = optimizer._perform_optimization(x0, bond_array, angle_array, box_size)
+            final_strains[method] = optimizer._total_strain(
+                optimized_positions.ravel(), bond_array, angle_array, box_size
+            )
+
+        assert final_strains["Newton-CG"] < optimizer._total_strain(x0, bond_array, angle_array, box_size)
+        assert np.isclose(final_strains["Newton-CG"], final_strains["L-BFGS-B"], rtol=1e-3)
+
+    def test_minimization_options_are_passed_to_solver(self, setup_structure_optimizer_small_system):
+        optimizer = setup_structure_optimizer_small_system
+        x0, bond_array, angle_array, box_size, _, _ = optimizer._prepare_optimization()
+
+        final_strains = {}
+        for maxiter in [2, 15000]:
+            optimizer.minimization_options = {"maxiter": maxiter}
+            optimized_positions = optimizer._perform_optimization(x0, bond_array, angle_array, box_size)
+            final_strains[maxiter] = optimizer._total_strain(
+                optimized_positions.ravel(), bond_array, angle_array, box_size
+            )
+
+        assert final_strains[2] > final_strains[15000]
+
+    def test_minimization_options_are_not_shared_between_optimizers(self, setup_structure_optimizer_small_system):
+        optimizer = setup_structure_optimizer_small_system
+        other_optimizer = StructureOptimizer(optimizer.structure, OptimizationConfig())
+
+        optimizer.minimization_options["maxiter"] = 2
+
+        assert other_optimizer.minimization_options == {}
+
     def test_optimize_positions(self, setup_structure_optimizer, optimized_reference_structure):
         """
         Test that the adjusted atom positions closely match the optimized reference structure.